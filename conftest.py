@@ -0,0 +1,15 @@
+"""Shared pytest configuration.
+
+Puts the ``tools`` directory on ``sys.path`` once for the whole session so
+test modules can import ``requirements_automation`` without each module
+repeating its own ``sys.path.insert``.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent
+TOOLS_DIR = str(REPO_ROOT / "tools")
+
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
@@ -5,9 +5,12 @@ Unit tests for DocumentValidator completion criteria checking.
 This test validates that the document validator correctly checks all
 completion criteria and provides accurate status reporting.
 """
+import functools
 import sys
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Sequence, Tuple
+
+import pytest
 
 # Add the tools directory to the path
 repo_root = Path(__file__).parent.parent
@@ -18,6 +21,57 @@ from requirements_automation.handler_registry import HandlerRegistry
 from requirements_automation.parsing import extract_workflow_order
 from requirements_automation.utils_io import read_text, split_lines
 
+# Shared by every test; DocumentValidator only reads handler configs from it
+_REGISTRY = HandlerRegistry(repo_root / "tools" / "config" / "handler_registry.yaml")
+
+
+# Fixed document fragments; create_test_document splices them around the flag-driven lines.
+_HEADER: Tuple[str, ...] = (
+    '<!-- meta:doc_type value="requirements" -->',
+    '<!-- meta:doc_format version="1.0" -->',
+    "",
+    "<!-- workflow:order",
+    "problem_statement",
+    "goals_objectives",
+    "review_gate:test_gate",
+    "assumptions",
+    "-->",
+    "",
+)
+_QUESTIONS_TABLE_HEAD: Tuple[str, ...] = (
+    "# Requirements Document",
+    "",
+    "## Open Questions",
+    "<!-- table:open_questions -->",
+    "| Question ID | Question | Date | Answer | Section Target | Resolution Status |",
+    "| ----------- | -------- | ---- | ------ | -------------- | ----------------- |",
+)
+_OPEN_ROW = "| Q-001 | Test question? | 2024-01-01 |  | problem_statement | Open |"
+_DEFERRED_ROW = "| Q-001 | Test question? | 2024-01-01 | Answer later | problem_statement | Deferred |"
+_RESOLVED_ROW = "| Q-001 | Test question? | 2024-01-01 | Test answer | problem_statement | Resolved |"
+_GOALS_SECTION: Tuple[str, ...] = (
+    "",
+    "<!-- section:goals_objectives -->",
+    "## Goals & Objectives",
+    "- Goal 1",
+    "- Goal 2",
+    "",
+)
+_DUPLICATE_GOALS: Tuple[str, ...] = (
+    "<!-- section:goals_objectives -->",
+    "## Duplicate Goals",
+    "",
+)
+_ASSUMPTIONS_SECTION: Tuple[str, ...] = (
+    "<!-- section:assumptions -->",
+    "## Assumptions",
+    "- Assumption 1",
+    "",
+)
+
+# The workflow block lives in _HEADER and no flag changes it, so parse it once
+_WORKFLOW_ORDER = extract_workflow_order(list(_HEADER))
+
 
 def create_test_document(
     has_placeholder: bool = False,
@@ -25,88 +79,77 @@ def create_test_document(
     has_review_gate_result: bool = False,
     review_gate_passed: bool = True,
     has_duplicate_markers: bool = False,
-) -> List[str]:
+    has_deferred_questions: bool = False,
+) -> Tuple[str, ...]:
     """Create a test document with various states."""
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        '<!-- meta:doc_format version="1.0" -->',
-        "",
-        "<!-- workflow:order",
-        "problem_statement",
-        "goals_objectives",
-        "review_gate:test_gate",
-        "assumptions",
-        "-->",
-        "",
-    ]
-
     # Add review gate result marker if requested
+    gate_result: Tuple[str, ...] = ()
     if has_review_gate_result:
         status = "passed" if review_gate_passed else "failed"
         issues = 0 if review_gate_passed else 1
-        lines.append(
-            f"<!-- review_gate_result:review_gate:test_gate status={status} issues={issues} warnings=0 -->"
-        )
-        lines.append("")
-
-    lines.extend(
-        [
-            "# Requirements Document",
+        gate_result = (
+            f"<!-- review_gate_result:review_gate:test_gate status={status} issues={issues} warnings=0 -->",
             "",
-            "## Open Questions",
-            "<!-- table:open_questions -->",
-            "| Question ID | Question | Date | Answer | Section Target | Resolution Status |",
-            "| ----------- | -------- | ---- | ------ | -------------- | ----------------- |",
-        ]
-    )
-
-    if has_open_questions:
-        lines.append("| Q-001 | Test question? | 2024-01-01 |  | problem_statement | Open |")
-    else:
-        lines.append(
-            "| Q-001 | Test question? | 2024-01-01 | Test answer | problem_statement | Resolved |"
         )
 
-    lines.extend(
-        [
-            "",
-            "<!-- section:problem_statement -->",
-            "## Problem Statement",
-        ]
-    )
-
-    if has_placeholder:
-        lines.append("<!-- PLACEHOLDER -->")
+    if has_open_questions:
+        question_row = _OPEN_ROW
+    elif has_deferred_questions:
+        question_row = _DEFERRED_ROW
     else:
-        lines.append("This is the problem statement.")
-
-    lines.extend(
-        [
-            "",
-            "<!-- section:goals_objectives -->",
-            "## Goals & Objectives",
-            "- Goal 1",
-            "- Goal 2",
-            "",
-        ]
+        question_row = _RESOLVED_ROW
+
+    # One tuple display instead of a chain of append/extend calls; no test mutates the
+    # document, and any that needs to can copy it with list()
+    return (
+        *_HEADER,
+        *gate_result,
+        *_QUESTIONS_TABLE_HEAD,
+        question_row,
+        "",
+        "<!-- section:problem_statement -->",
+        "## Problem Statement",
+        "<!-- PLACEHOLDER -->" if has_placeholder else "This is the problem statement.",
+        *_GOALS_SECTION,
+        *(_DUPLICATE_GOALS if has_duplicate_markers else ()),
+        *_ASSUMPTIONS_SECTION,
     )
 
-    # Add duplicate marker if requested
-    if has_duplicate_markers:
-        lines.append("<!-- section:goals_objectives -->")
-        lines.append("## Duplicate Goals")
-        lines.append("")
-
-    lines.extend(
-        [
-            "<!-- section:assumptions -->",
-            "## Assumptions",
-            "- Assumption 1",
-            "",
-        ]
-    )
 
-    return lines
+# (case id, create_test_document flags, blocking criterion the validator must report)
+INCOMPLETE_CASES: List[Tuple[str, Dict[str, bool], str]] = [
+    (
+        "placeholder",
+        {"has_placeholder": True, "has_review_gate_result": True},
+        "no_placeholders_in_required_sections",
+    ),
+    (
+        "open_questions",
+        {"has_open_questions": True, "has_review_gate_result": True},
+        "no_open_questions",
+    ),
+    (
+        "failed_review_gate",
+        {"has_review_gate_result": True, "review_gate_passed": False},
+        "all_review_gates_pass",
+    ),
+    (
+        "duplicate_markers",
+        {"has_review_gate_result": True, "has_duplicate_markers": True},
+        "structure_valid",
+    ),
+    (
+        "unexecuted_review_gate",
+        {"has_review_gate_result": False},
+        "all_review_gates_pass",
+    ),
+]
+
+
+def _validate(lines: Sequence[str]):
+    """Run the non-strict completion check with the shared registry and workflow order."""
+    validator = DocumentValidator(lines, _WORKFLOW_ORDER, _REGISTRY, "requirements")
+    return validator.validate_completion(strict=False)
 
 
 def test_complete_document():
@@ -120,12 +163,7 @@ def test_complete_document():
         review_gate_passed=True,
     )
 
-    workflow_order = extract_workflow_order(lines)
-    config_path = repo_root / "config" / "handler_registry.yaml"
-    registry = HandlerRegistry(config_path)
-
-    validator = DocumentValidator(lines, workflow_order, registry, "requirements")
-    status = validator.validate_completion(strict=False)
+    status = _validate(lines)
 
     if status.complete:
         print("  ✓ Document marked as COMPLETE")
@@ -140,148 +178,21 @@ def test_complete_document():
         return False
 
 
-def test_document_with_placeholder():
-    """Test that document with PLACEHOLDER fails completion."""
-    print("\nTest 2: Document with PLACEHOLDER token...")
-
-    lines = create_test_document(
-        has_placeholder=True,
-        has_open_questions=False,
-        has_review_gate_result=True,
-        review_gate_passed=True,
-    )
-
-    workflow_order = extract_workflow_order(lines)
-    config_path = repo_root / "config" / "handler_registry.yaml"
-    registry = HandlerRegistry(config_path)
-
-    validator = DocumentValidator(lines, workflow_order, registry, "requirements")
-    status = validator.validate_completion(strict=False)
-
-    if not status.complete and "no_placeholders_in_required_sections" in status.blocking_failures:
-        print("  ✓ Document correctly marked as INCOMPLETE")
-        print(f"  ✓ Failed criterion: no_placeholders_in_required_sections")
-        return True
-    else:
-        print(f"  ✗ Document should be INCOMPLETE due to placeholder")
-        print(f"  ✗ Blocking failures: {status.blocking_failures}")
-        return False
-
-
-def test_document_with_open_questions():
-    """Test that document with Open questions fails completion."""
-    print("\nTest 3: Document with Open questions...")
-
-    lines = create_test_document(
-        has_placeholder=False,
-        has_open_questions=True,
-        has_review_gate_result=True,
-        review_gate_passed=True,
-    )
-
-    workflow_order = extract_workflow_order(lines)
-    config_path = repo_root / "config" / "handler_registry.yaml"
-    registry = HandlerRegistry(config_path)
-
-    validator = DocumentValidator(lines, workflow_order, registry, "requirements")
-    status = validator.validate_completion(strict=False)
-
-    if not status.complete and "no_open_questions" in status.blocking_failures:
-        print("  ✓ Document correctly marked as INCOMPLETE")
-        print(f"  ✓ Failed criterion: no_open_questions")
-        # Find the check details
-        for check in status.checks:
-            if check.criterion == "no_open_questions":
-                print(f"  ✓ Details: {check.details}")
-        return True
-    else:
-        print(f"  ✗ Document should be INCOMPLETE due to open questions")
-        print(f"  ✗ Blocking failures: {status.blocking_failures}")
-        return False
-
-
-def test_document_with_failed_review_gate():
-    """Test that document with failed review gate fails completion."""
-    print("\nTest 4: Document with failed review gate...")
-
-    lines = create_test_document(
-        has_placeholder=False,
-        has_open_questions=False,
-        has_review_gate_result=True,
-        review_gate_passed=False,
-    )
-
-    workflow_order = extract_workflow_order(lines)
-    config_path = repo_root / "config" / "handler_registry.yaml"
-    registry = HandlerRegistry(config_path)
-
-    validator = DocumentValidator(lines, workflow_order, registry, "requirements")
-    status = validator.validate_completion(strict=False)
-
-    if not status.complete and "all_review_gates_pass" in status.blocking_failures:
-        print("  ✓ Document correctly marked as INCOMPLETE")
-        print(f"  ✓ Failed criterion: all_review_gates_pass")
-        return True
-    else:
-        print(f"  ✗ Document should be INCOMPLETE due to failed review gate")
-        print(f"  ✗ Blocking failures: {status.blocking_failures}")
-        return False
-
-
-def test_document_with_duplicate_markers():
-    """Test that document with duplicate section markers fails completion."""
-    print("\nTest 5: Document with duplicate section markers...")
-
-    lines = create_test_document(
-        has_placeholder=False,
-        has_open_questions=False,
-        has_review_gate_result=True,
-        review_gate_passed=True,
-        has_duplicate_markers=True,
-    )
-
-    workflow_order = extract_workflow_order(lines)
-    config_path = repo_root / "config" / "handler_registry.yaml"
-    registry = HandlerRegistry(config_path)
-
-    validator = DocumentValidator(lines, workflow_order, registry, "requirements")
-    status = validator.validate_completion(strict=False)
-
-    if not status.complete and "structure_valid" in status.blocking_failures:
-        print("  ✓ Document correctly marked as INCOMPLETE")
-        print(f"  ✓ Failed criterion: structure_valid")
-        return True
-    else:
-        print(f"  ✗ Document should be INCOMPLETE due to duplicate markers")
-        print(f"  ✗ Blocking failures: {status.blocking_failures}")
-        return False
+@pytest.mark.parametrize(
+    "case_id, flags, criterion", INCOMPLETE_CASES, ids=[c[0] for c in INCOMPLETE_CASES]
+)
+def test_incomplete_document(case_id, flags, criterion):
+    """Test that each incomplete document fails on the expected criterion."""
+    print(f"\nIncomplete document: {case_id}...")
 
+    status = _validate(create_test_document(**flags))
 
-def test_document_without_review_gate_result():
-    """Test that document without review gate execution fails completion."""
-    print("\nTest 6: Document with unexecuted review gate...")
-
-    lines = create_test_document(
-        has_placeholder=False,
-        has_open_questions=False,
-        has_review_gate_result=False,  # No review gate result
+    assert not status.complete, f"{case_id}: document should be INCOMPLETE"
+    assert criterion in status.blocking_failures, (
+        f"{case_id}: expected {criterion}, got {status.blocking_failures}"
     )
-
-    workflow_order = extract_workflow_order(lines)
-    config_path = repo_root / "config" / "handler_registry.yaml"
-    registry = HandlerRegistry(config_path)
-
-    validator = DocumentValidator(lines, workflow_order, registry, "requirements")
-    status = validator.validate_completion(strict=False)
-
-    if not status.complete and "all_review_gates_pass" in status.blocking_failures:
-        print("  ✓ Document correctly marked as INCOMPLETE")
-        print(f"  ✓ Failed criterion: all_review_gates_pass")
-        return True
-    else:
-        print(f"  ✗ Document should be INCOMPLETE due to unexecuted review gate")
-        print(f"  ✗ Blocking failures: {status.blocking_failures}")
-        return False
+    print(f"  ✓ Failed criterion: {criterion}")
+    return True
 
 
 def test_strict_mode_with_deferred_questions():
@@ -293,20 +204,10 @@ def test_strict_mode_with_deferred_questions():
         has_open_questions=False,
         has_review_gate_result=True,
         review_gate_passed=True,
+        has_deferred_questions=True,
     )
 
-    # Replace resolved question with deferred one
-    for i, line in enumerate(lines):
-        if "| Q-001 |" in line:
-            lines[i] = (
-                "| Q-001 | Test question? | 2024-01-01 | Answer later | problem_statement | Deferred |"
-            )
-
-    workflow_order = extract_workflow_order(lines)
-    config_path = repo_root / "config" / "handler_registry.yaml"
-    registry = HandlerRegistry(config_path)
-
-    validator = DocumentValidator(lines, workflow_order, registry, "requirements")
+    validator = DocumentValidator(lines, _WORKFLOW_ORDER, _REGISTRY, "requirements")
 
     # Normal mode should pass
     status_normal = validator.validate_completion(strict=False)
@@ -334,12 +235,7 @@ def test_human_readable_output():
         has_review_gate_result=False,
     )
 
-    workflow_order = extract_workflow_order(lines)
-    config_path = repo_root / "config" / "handler_registry.yaml"
-    registry = HandlerRegistry(config_path)
-
-    validator = DocumentValidator(lines, workflow_order, registry, "requirements")
-    status = validator.validate_completion(strict=False)
+    status = _validate(lines)
 
     if status.summary:
         print("  ✓ Summary generated")
@@ -373,11 +269,10 @@ def main():
 
     tests = [
         test_complete_document,
-        test_document_with_placeholder,
-        test_document_with_open_questions,
-        test_document_with_failed_review_gate,
-        test_document_with_duplicate_markers,
-        test_document_without_review_gate_result,
+        *(
+            functools.partial(test_incomplete_document, *case)
+            for case in INCOMPLETE_CASES
+        ),
         test_strict_mode_with_deferred_questions,
         test_human_readable_output,
     ]
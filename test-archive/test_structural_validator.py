@@ -11,11 +11,12 @@ This test validates that the structural validator correctly detects:
 """
 import sys
 from pathlib import Path
-from typing import List
 
-# Add the tools directory to the path
-repo_root = Path(__file__).parent.parent
-sys.path.insert(0, str(repo_root / "tools"))
+# requirements_automation is importable via the repo-level conftest.py (the insert is
+# kept, guarded, so the module still imports when run as a script)
+_tools_dir = str(Path(__file__).parent.parent / "tools")
+if _tools_dir not in sys.path:
+    sys.path.insert(0, _tools_dir)
 
 from requirements_automation.structural_validator import (
     StructuralValidator,
@@ -25,8 +26,114 @@ from requirements_automation.validation_errors import (
     DuplicateSectionError,
     InvalidSpanError,
     MalformedMarkerError,
-    OrphanedLockError,
-    TableSchemaError,
+)
+
+
+# Shared fixtures. Tests take a list() copy because the validator may repair
+# (mutate) the lines it is given.
+_PREAMBLE = (
+    '<!-- meta:doc_type value="requirements" -->',
+    "<!-- workflow:order",
+    "problem_statement",
+    "-->",
+    "",
+)
+
+_VALID_DOC = _PREAMBLE + (
+    "<!-- section:problem_statement -->",
+    "## Problem Statement",
+    "This is the problem statement.",
+    "<!-- section_lock:problem_statement lock=false -->",
+    "",
+    "<!-- table:open_questions -->",
+    "| Question ID | Question | Date | Answer | Section Target | Resolution Status |",
+    "| ----------- | -------- | ---- | ------ | -------------- | ----------------- |",
+    "| Q-001 | Test? | 2024-01-01 | Yes | problem_statement | Resolved |",
+)
+
+_DUPLICATE_SECTION_DOC = _PREAMBLE + (
+    "<!-- section:problem_statement -->",
+    "## Problem Statement",
+    "First occurrence.",
+    "",
+    "<!-- section:problem_statement -->",
+    "## Problem Statement (Duplicate)",
+    "Second occurrence.",
+)
+
+_MALFORMED_SECTION_DOC = _PREAMBLE + (
+    "<!-- section:problem_statement -->",
+    "## Problem Statement",
+    "Content here.",
+    "<!-- section:problem-statement -->",  # Invalid: contains hyphen, won't match regex
+    "This won't be treated as a section marker.",
+)
+
+_ORPHANED_LOCK_DOC = _PREAMBLE + (
+    "<!-- section:problem_statement -->",
+    "## Problem Statement",
+    "Content here.",
+    "",
+    "<!-- section_lock:nonexistent_section lock=true -->",  # Orphaned lock
+)
+
+_WRONG_COLUMNS_DOC = _PREAMBLE + (
+    "<!-- table:open_questions -->",
+    "| ID | Question | Answer |",  # Wrong columns
+    "| -- | -------- | ------ |",
+    "| Q-001 | Test? | Yes |",  # This will also trigger pipe count error
+    "",
+    "<!-- section:problem_statement -->",
+    "## Problem Statement",
+    "Content.",
+)
+
+_WRONG_PIPE_COUNT_DOC = _PREAMBLE + (
+    "<!-- table:open_questions -->",
+    "| Question ID | Question | Date | Answer | Section Target | Resolution Status |",
+    "| ----------- | -------- | ---- | ------ | -------------- | ----------------- |",
+    "| Q-001 | Test? | 2024-01-01 |",  # Missing pipes
+    "",
+    "<!-- section:problem_statement -->",
+    "## Problem Statement",
+    "Content.",
+)
+
+_MULTIPLE_ERRORS_DOC = _PREAMBLE + (
+    "<!-- section:problem_statement -->",
+    "## Problem Statement",
+    "First occurrence.",
+    "",
+    "<!-- section:problem_statement -->",  # Duplicate
+    "## Problem Statement (Duplicate)",
+    "Second occurrence.",
+    "",
+    "<!-- section_lock:nonexistent lock=true -->",  # Orphaned
+    "",
+)
+
+_DUPLICATE_SECTION_SHORT_DOC = _PREAMBLE + (
+    "<!-- section:problem_statement -->",
+    "## Problem Statement",
+    "First occurrence.",
+    "",
+    "<!-- section:problem_statement -->",  # Duplicate
+    "Second occurrence.",
+)
+
+_MINIMAL_VALID_DOC = _PREAMBLE + (
+    "<!-- section:problem_statement -->",
+    "## Problem Statement",
+    "Content.",
+)
+
+# Template with a second section that _MINIMAL_VALID_DOC lacks, for repair tests
+_TWO_SECTION_TEMPLATE = _MINIMAL_VALID_DOC + (
+    "",
+    "<!-- section:assumptions -->",
+    "## Assumptions",
+    "Template assumptions.",
+    "<!-- section_lock:assumptions lock=false -->",
 )
 
 
@@ -35,22 +142,7 @@ def test_valid_document():
     print("\nTest: Valid Document")
     print("=" * 70)
 
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        "<!-- workflow:order",
-        "problem_statement",
-        "-->",
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement",
-        "This is the problem statement.",
-        "<!-- section_lock:problem_statement lock=false -->",
-        "",
-        "<!-- table:open_questions -->",
-        "| Question ID | Question | Date | Answer | Section Target | Resolution Status |",
-        "| ----------- | -------- | ---- | ------ | -------------- | ----------------- |",
-        "| Q-001 | Test? | 2024-01-01 | Yes | problem_statement | Resolved |",
-    ]
+    lines = list(_VALID_DOC)
 
     validator = StructuralValidator(lines)
     errors = validator.validate_all()
@@ -70,25 +162,12 @@ def test_duplicate_section_markers():
     print("\nTest: Duplicate Section Markers")
     print("=" * 70)
 
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        "<!-- workflow:order",
-        "problem_statement",
-        "-->",
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement",
-        "First occurrence.",
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement (Duplicate)",
-        "Second occurrence.",
-    ]
+    lines = list(_DUPLICATE_SECTION_DOC)
 
     validator = StructuralValidator(lines)
     errors = validator.validate_all()
 
-    duplicate_errors = [e for e in errors if isinstance(e, DuplicateSectionError)]
+    duplicate_errors = validator.report.duplicate_sections
 
     if len(duplicate_errors) == 1:
         error = duplicate_errors[0]
@@ -108,18 +187,7 @@ def test_malformed_section_marker():
     print("\nTest: Malformed Section Marker (regex doesn't match)")
     print("=" * 70)
 
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        "<!-- workflow:order",
-        "problem_statement",
-        "-->",
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement",
-        "Content here.",
-        "<!-- section:problem-statement -->",  # Invalid: contains hyphen, won't match regex
-        "This won't be treated as a section marker.",
-    ]
+    lines = list(_MALFORMED_SECTION_DOC)
 
     validator = StructuralValidator(lines)
     errors = validator.validate_all()
@@ -141,23 +209,12 @@ def test_orphaned_lock_marker():
     print("\nTest: Orphaned Lock Marker")
     print("=" * 70)
 
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        "<!-- workflow:order",
-        "problem_statement",
-        "-->",
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement",
-        "Content here.",
-        "",
-        "<!-- section_lock:nonexistent_section lock=true -->",  # Orphaned lock
-    ]
+    lines = list(_ORPHANED_LOCK_DOC)
 
     validator = StructuralValidator(lines)
     errors = validator.validate_all()
 
-    orphaned_errors = [e for e in errors if isinstance(e, OrphanedLockError)]
+    orphaned_errors = validator.report.orphaned_locks
 
     if len(orphaned_errors) == 1:
         error = orphaned_errors[0]
@@ -177,26 +234,12 @@ def test_table_schema_wrong_columns():
     print("\nTest: Table Schema - Wrong Columns")
     print("=" * 70)
 
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        "<!-- workflow:order",
-        "problem_statement",
-        "-->",
-        "",
-        "<!-- table:open_questions -->",
-        "| ID | Question | Answer |",  # Wrong columns
-        "| -- | -------- | ------ |",
-        "| Q-001 | Test? | Yes |",  # This will also trigger pipe count error
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement",
-        "Content.",
-    ]
+    lines = list(_WRONG_COLUMNS_DOC)
 
     validator = StructuralValidator(lines)
     errors = validator.validate_all()
 
-    table_errors = [e for e in errors if isinstance(e, TableSchemaError)]
+    table_errors = validator.report.table_errors
 
     # Should detect at least the column mismatch error (may also detect row errors)
     if len(table_errors) >= 1:
@@ -221,26 +264,12 @@ def test_table_schema_wrong_pipe_count():
     print("\nTest: Table Schema - Wrong Pipe Count")
     print("=" * 70)
 
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        "<!-- workflow:order",
-        "problem_statement",
-        "-->",
-        "",
-        "<!-- table:open_questions -->",
-        "| Question ID | Question | Date | Answer | Section Target | Resolution Status |",
-        "| ----------- | -------- | ---- | ------ | -------------- | ----------------- |",
-        "| Q-001 | Test? | 2024-01-01 |",  # Missing pipes
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement",
-        "Content.",
-    ]
+    lines = list(_WRONG_PIPE_COUNT_DOC)
 
     validator = StructuralValidator(lines)
     errors = validator.validate_all()
 
-    table_errors = [e for e in errors if isinstance(e, TableSchemaError)]
+    table_errors = validator.report.table_errors
 
     if len(table_errors) >= 1:
         error = table_errors[0]
@@ -260,29 +289,13 @@ def test_multiple_errors():
     print("\nTest: Multiple Structural Errors")
     print("=" * 70)
 
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        "<!-- workflow:order",
-        "problem_statement",
-        "-->",
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement",
-        "First occurrence.",
-        "",
-        "<!-- section:problem_statement -->",  # Duplicate
-        "## Problem Statement (Duplicate)",
-        "Second occurrence.",
-        "",
-        "<!-- section_lock:nonexistent lock=true -->",  # Orphaned
-        "",
-    ]
+    lines = list(_MULTIPLE_ERRORS_DOC)
 
     validator = StructuralValidator(lines)
     errors = validator.validate_all()
 
-    duplicate_count = len([e for e in errors if isinstance(e, DuplicateSectionError)])
-    orphaned_count = len([e for e in errors if isinstance(e, OrphanedLockError)])
+    duplicate_count = len(validator.report.duplicate_sections)
+    orphaned_count = len(validator.report.orphaned_locks)
 
     # Note: Malformed markers that don't match regex aren't detected as errors
     # They're simply not recognized as markers at all
@@ -303,19 +316,7 @@ def test_validate_or_raise():
     print("\nTest: validate_or_raise()")
     print("=" * 70)
 
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        "<!-- workflow:order",
-        "problem_statement",
-        "-->",
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement",
-        "First occurrence.",
-        "",
-        "<!-- section:problem_statement -->",  # Duplicate
-        "Second occurrence.",
-    ]
+    lines = list(_DUPLICATE_SECTION_SHORT_DOC)
 
     validator = StructuralValidator(lines)
 
@@ -336,19 +337,7 @@ def test_error_reporting():
     print("\nTest: Error Reporting")
     print("=" * 70)
 
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        "<!-- workflow:order",
-        "problem_statement",
-        "-->",
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement",
-        "First occurrence.",
-        "",
-        "<!-- section:problem_statement -->",  # Duplicate
-        "Second occurrence.",
-    ]
+    lines = list(_DUPLICATE_SECTION_SHORT_DOC)
 
     validator = StructuralValidator(lines)
     errors = validator.validate_all()
@@ -369,16 +358,7 @@ def test_valid_document_report():
     print("\nTest: Valid Document Report")
     print("=" * 70)
 
-    lines = [
-        '<!-- meta:doc_type value="requirements" -->',
-        "<!-- workflow:order",
-        "problem_statement",
-        "-->",
-        "",
-        "<!-- section:problem_statement -->",
-        "## Problem Statement",
-        "Content.",
-    ]
+    lines = list(_MINIMAL_VALID_DOC)
 
     validator = StructuralValidator(lines)
     errors = validator.validate_all()
@@ -393,6 +373,23 @@ def test_valid_document_report():
         return False
 
 
+def test_tuple_template_repair():
+    """Test that a tuple template can drive repair of a missing section."""
+    print("\nTest: Repair From Tuple Template")
+    print("=" * 70)
+
+    lines = list(_MINIMAL_VALID_DOC)
+
+    validator = StructuralValidator(lines, _TWO_SECTION_TEMPLATE)
+    errors = validator.validate_all()
+
+    assert errors == [], f"Expected no errors after repair, got {errors}"
+    assert validator.repairs_made == ["section:assumptions"]
+    assert "<!-- section:assumptions -->" in lines
+    print(f"  ✓ Missing section repaired: {validator.repairs_made}")
+    return True
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 70)
@@ -410,6 +407,7 @@ def main():
         test_validate_or_raise,
         test_error_reporting,
         test_valid_document_report,
+        test_tuple_template_repair,
     ]
 
     results = []
@@ -9,9 +9,12 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock, Mock
 
-# Add the tools directory to the path
+# requirements_automation is importable via the repo-level conftest.py (the insert is
+# kept, guarded, so the module still imports when run as a script)
 repo_root = Path(__file__).parent.parent
-sys.path.insert(0, str(repo_root / "tools"))
+_tools_dir = str(repo_root / "tools")
+if _tools_dir not in sys.path:
+    sys.path.insert(0, _tools_dir)
 
 from requirements_automation.handler_registry import HandlerRegistry
 from requirements_automation.runner_v2 import WorkflowRunner
@@ -8,21 +8,27 @@ newly created files were left untracked).
 
 Note: This test requires mocking the LLM client since we don't have an API key.
 """
+import io
 import os
-import shutil
+import shlex
 import subprocess
 import sys
-import tempfile
+import tarfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-# Add the tools directory to the path
+import pytest
+
+# Add the tools directory to the path (already done by the root conftest under pytest;
+# kept, guarded, so the module still imports when run as a script)
 repo_root = Path(__file__).parent.parent
-sys.path.insert(0, str(repo_root / "tools"))
+_tools_dir = str(repo_root / "tools")
+if _tools_dir not in sys.path:
+    sys.path.insert(0, _tools_dir)
 
 # Import after path is set
 from requirements_automation.cli import main
-from requirements_automation.models import RunResult
 
 
 def create_mock_llm():
@@ -32,407 +38,201 @@ def create_mock_llm():
 
 
 def create_mock_runner_result(changed=False, blocked=False, target_id="problem_statement"):
-    """Create a mock workflow runner result."""
-    result = MagicMock()
-    result.changed = changed
-    result.blocked = blocked
-    result.blocked_reasons = []
-    result.target_id = target_id
-    result.action_taken = "no-op"
-    return result
-
-
-def test_template_creation_commits_file():
-    """Test that creating a doc from template commits the file."""
-    print("Test 1: CLI template creation commits new file...")
-
-    # Create a temporary git repo for testing
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        test_repo = tmpdir_path / "work"
-        bare_repo = tmpdir_path / "bare.git"
-
-        # Create a bare repo to push to
-        subprocess.run(["git", "init", "--bare", str(bare_repo)], check=True, capture_output=True)
-
-        # Initialize working git repo
-        test_repo.mkdir()
-        subprocess.run(["git", "init"], cwd=test_repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "remote", "add", "origin", str(bare_repo)],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-        )
-
-        # Copy template file
-        template_dir = test_repo / "docs" / "templates"
-        template_dir.mkdir(parents=True)
-        original_template = repo_root / "docs" / "templates" / "requirements-template.md"
-        template_path = template_dir / "requirements-template.md"
-        shutil.copy2(original_template, template_path)
-
-        # Copy config directory (needed for handler registry)
-        config_dir = test_repo / "config"
-        config_dir.mkdir(parents=True)
-        original_config = repo_root / "config" / "handler_registry.yaml"
-        config_path = config_dir / "handler_registry.yaml"
-        shutil.copy2(original_config, config_path)
-
-        # Commit the template and config
-        subprocess.run(["git", "add", "."], cwd=test_repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit with template"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "push", "-u", "origin", "master"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-        )
-
-        # Check that working tree is clean
-        status_before = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout
-
-        if status_before.strip():
-            print(f"  ✗ Working tree not clean before test: {status_before}")
-            return False
-
-        # Create path for new doc
-        new_doc_path = test_repo / "docs" / "my-requirements.md"
-
-        # Run CLI to create doc from template with mocked LLM and runner
-        argv = [
-            "--template",
-            str(template_path),
-            "--doc",
-            str(new_doc_path),
-            "--repo-root",
-            str(test_repo),
-            "--log-level",
-            "WARNING",  # Reduce noise in test output
-        ]
+    """Create a stand-in workflow runner result (plain attributes, no mock machinery)."""
+    return SimpleNamespace(
+        changed=changed,
+        blocked=blocked,
+        blocked_reasons=[],
+        target_id=target_id,
+        action_taken="no-op",
+    )
+
+
+# Test-side git: no hooks, no signing probes, no user/system gitconfig lookups
+GIT = [
+    "git",
+    "-c",
+    "core.hooksPath=/dev/null",
+    "-c",
+    "commit.gpgsign=false",
+    "-c",
+    "init.defaultBranch=master",
+]
+_GIT_ENV = {**os.environ, "GIT_CONFIG_GLOBAL": "/dev/null", "GIT_CONFIG_SYSTEM": "/dev/null"}
+
+# One shell invocation for the whole bootstrap instead of one process per git command.
+_GIT_SH = shlex.join(GIT)
+_BOOTSTRAP_SCRIPT = " && ".join(
+    [
+        f"{_GIT_SH} init --quiet",
+        f"{_GIT_SH} config user.email test@example.com",
+        f"{_GIT_SH} config user.name 'Test User'",
+        f"{_GIT_SH} add .",
+        f"{_GIT_SH} commit --quiet -m 'Initial commit with template'",
+    ]
+)
+
+# The CLI pushes after committing; tests have no remote, so only that call is skipped.
+_real_check_call = subprocess.check_call
+
+
+def _check_call_without_push(cmd, *args, **kwargs):
+    """subprocess.check_call stand-in that no-ops `git push` and runs everything else."""
+    if cmd[:2] == ["git", "push"]:
+        return 0
+    return _real_check_call(cmd, *args, **kwargs)
+
+
+def _bootstrap_repo(test_repo):
+    """Initialize test_repo as a git repo and commit its contents."""
+    subprocess.run(
+        ["bash", "-c", _BOOTSTRAP_SCRIPT],
+        cwd=test_repo,
+        env=_GIT_ENV,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _git_output(repo, *args):
+    """Run a read-only test-side git command in repo and return its stdout."""
+    return subprocess.run(
+        [*GIT, *args],
+        cwd=repo,
+        env=_GIT_ENV,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def _porcelain_status(repo):
+    """Return `git status --porcelain` output for repo."""
+    return _git_output(repo, "status", "--porcelain")
+
+
+def _head_subject(repo):
+    """Return the subject line of the HEAD commit in repo."""
+    return _git_output(repo, "log", "-1", "--format=%s").strip()
+
+
+# Fixture sources, read once at import
+_TEMPLATE_BYTES = (repo_root / "docs" / "templates" / "requirements-template.md").read_bytes()
+_CONFIG_BYTES = (repo_root / "tools" / "config" / "handler_registry.yaml").read_bytes()
+
+# Use the safe "data" extraction filter where available (avoids the 3.12+ DeprecationWarning)
+_EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+@pytest.fixture(scope="module")
+def prepared_repo(tmp_path_factory):
+    """
+    Build the git fixture once per module: a working repo with the template and
+    handler registry committed, returned as an in-memory tar archive (bytes).
+    """
+    test_repo = tmp_path_factory.mktemp("template_repo")
+
+    # Write template file
+    template_dir = test_repo / "docs" / "templates"
+    template_dir.mkdir(parents=True)
+    (template_dir / "requirements-template.md").write_bytes(_TEMPLATE_BYTES)
+
+    # Write handler registry (loaded by the CLI from tools/config under --repo-root)
+    config_dir = test_repo / "tools" / "config"
+    config_dir.mkdir(parents=True)
+    (config_dir / "handler_registry.yaml").write_bytes(_CONFIG_BYTES)
+
+    _bootstrap_repo(test_repo)
+    # Checked once here; every test starts from this snapshot
+    assert not _porcelain_status(test_repo).strip(), "bootstrap left the working tree dirty"
+
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        tar.add(test_repo, arcname=".")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def test_repo(prepared_repo, tmp_path):
+    """Function-scoped copy of the prepared repo, extracted from the in-memory archive."""
+    work = tmp_path / "work"
+    with tarfile.open(fileobj=io.BytesIO(prepared_repo)) as tar:
+        tar.extractall(work, **_EXTRACT_KWARGS)
+    return work
+
+
+def _run_cli_creation(test_repo, template_path, new_doc_path, extra_flags):
+    """Run the CLI to create new_doc_path from the template with LLM and runner mocked."""
+    argv = [
+        "--template",
+        str(template_path),
+        "--doc",
+        str(new_doc_path),
+        "--repo-root",
+        str(test_repo),
+        *extra_flags,
+        "--log-level",
+        "WARNING",  # Reduce noise in test output
+    ]
 
+    # Skip the CLI's final `git push` (no remote); add/commit still run for real
+    with patch(
+        "requirements_automation.git_utils.subprocess.check_call",
+        side_effect=_check_call_without_push,
+    ):
         # Mock the LLM client and WorkflowRunner to avoid API calls
         with patch("requirements_automation.cli.LLMClient") as mock_llm_class:
             with patch("requirements_automation.cli.WorkflowRunner") as mock_runner_class:
-                # Setup mocks
                 mock_llm = create_mock_llm()
                 mock_llm_class.return_value = mock_llm
 
-                mock_runner = MagicMock()
-                mock_runner_class.return_value = mock_runner
-
-                # Make run_once return a no-op result (unchanged=False)
+                # Runner stub: run_once returns a no-op result (unchanged=False)
                 mock_result = create_mock_runner_result(changed=False)
-                mock_runner.run_once.return_value = mock_result
-                mock_runner.lines = []  # Unchanged lines
-
-                exit_code = main(argv)
-
-        # Check that CLI succeeded
-        if exit_code != 0:
-            print(f"  ✗ CLI returned exit code {exit_code} (expected 0)")
-            return False
-
-        # Check that the new document exists
-        if not new_doc_path.exists():
-            print(f"  ✗ New document was not created: {new_doc_path}")
-            return False
-
-        # Check that working tree is clean (file should be committed)
-        status_after = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout
-
-        if status_after.strip():
-            print(f"  ✗ Working tree not clean after CLI run (file not committed):")
-            print(f"     {status_after}")
-            return False
-
-        # Verify the file was actually committed
-        log_output = subprocess.run(
-            ["git", "log", "--oneline", "-1"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout
-
-        if "requirements: initialize from template" not in log_output:
-            print(f"  ✗ Commit message doesn't match expected:")
-            print(f"     Got: {log_output}")
-            return False
-
-        print("  ✓ New document created from template and committed")
-        print(f"  ✓ Commit message: {log_output.strip()}")
-        return True
-
-
-def test_template_creation_with_no_commit_flag():
-    """Test that --no-commit flag prevents committing template creation."""
-    print("\nTest 2: CLI template creation with --no-commit flag...")
-
-    # Create a temporary git repo for testing
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_repo = Path(tmpdir)
-
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=test_repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-        )
-
-        # Copy template file
-        template_dir = test_repo / "docs" / "templates"
-        template_dir.mkdir(parents=True)
-        original_template = repo_root / "docs" / "templates" / "requirements-template.md"
-        template_path = template_dir / "requirements-template.md"
-        shutil.copy2(original_template, template_path)
-
-        # Copy config directory
-        config_dir = test_repo / "config"
-        config_dir.mkdir(parents=True)
-        original_config = repo_root / "config" / "handler_registry.yaml"
-        config_path = config_dir / "handler_registry.yaml"
-        shutil.copy2(original_config, config_path)
-
-        # Commit the template and config
-        subprocess.run(["git", "add", "."], cwd=test_repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit with template"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
+                mock_runner_class.return_value = SimpleNamespace(
+                    run_once=lambda dry_run=False: mock_result,
+                    lines=[],  # Unchanged lines
+                )
+
+                return main(argv)
+
+
+@pytest.mark.parametrize(
+    "extra_flag,expect_committed",
+    [
+        (None, True),  # default: new doc is committed
+        ("--no-commit", False),  # doc created but left untracked
+        ("--dry-run", False),  # template copy happens before the dry-run check; no commit
+    ],
+)
+def test_template_creation(test_repo, extra_flag, expect_committed):
+    """Test that creating a doc from template commits it unless --no-commit/--dry-run is set."""
+    template_path = test_repo / "docs" / "templates" / "requirements-template.md"
+    new_doc_path = test_repo / "docs" / "my-requirements.md"
+
+    extra_flags = [extra_flag] if extra_flag else []
+    exit_code = _run_cli_creation(test_repo, template_path, new_doc_path, extra_flags)
+
+    assert exit_code == 0, f"CLI returned exit code {exit_code} (expected 0)"
+    assert new_doc_path.exists(), f"New document was not created: {new_doc_path}"
+
+    status_after = _porcelain_status(test_repo)
+
+    if not expect_committed:
+        assert "??" in status_after, (
+            f"File should be untracked with {extra_flag}, but status is: {status_after}"
         )
+        return
 
-        # Create path for new doc
-        new_doc_path = test_repo / "docs" / "my-requirements.md"
-
-        # Run CLI with --no-commit flag
-        argv = [
-            "--template",
-            str(template_path),
-            "--doc",
-            str(new_doc_path),
-            "--repo-root",
-            str(test_repo),
-            "--no-commit",
-            "--log-level",
-            "WARNING",
-        ]
-
-        # Mock the LLM client and WorkflowRunner
-        with patch("requirements_automation.cli.LLMClient") as mock_llm_class:
-            with patch("requirements_automation.cli.WorkflowRunner") as mock_runner_class:
-                mock_llm = create_mock_llm()
-                mock_llm_class.return_value = mock_llm
-
-                mock_runner = MagicMock()
-                mock_runner_class.return_value = mock_runner
-                mock_result = create_mock_runner_result(changed=False)
-                mock_runner.run_once.return_value = mock_result
-                mock_runner.lines = []
-
-                exit_code = main(argv)
-
-        # Check that CLI succeeded
-        if exit_code != 0:
-            print(f"  ✗ CLI returned exit code {exit_code} (expected 0)")
-            return False
-
-        # Check that the new document exists
-        if not new_doc_path.exists():
-            print(f"  ✗ New document was not created: {new_doc_path}")
-            return False
-
-        # Check that file is untracked (not committed)
-        status_after = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout
-
-        if "??" not in status_after:
-            print(f"  ✗ File should be untracked but status is: {status_after}")
-            return False
-
-        print("  ✓ New document created but not committed (as expected with --no-commit)")
-        return True
-
-
-def test_template_creation_with_dry_run_flag():
-    """Test that --dry-run flag prevents both file creation and commit."""
-    print("\nTest 3: CLI template creation with --dry-run flag...")
-
-    # Create a temporary git repo for testing
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_repo = Path(tmpdir)
-
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=test_repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-        )
-
-        # Copy template file
-        template_dir = test_repo / "docs" / "templates"
-        template_dir.mkdir(parents=True)
-        original_template = repo_root / "docs" / "templates" / "requirements-template.md"
-        template_path = template_dir / "requirements-template.md"
-        shutil.copy2(original_template, template_path)
-
-        # Copy config directory
-        config_dir = test_repo / "config"
-        config_dir.mkdir(parents=True)
-        original_config = repo_root / "config" / "handler_registry.yaml"
-        config_path = config_dir / "handler_registry.yaml"
-        shutil.copy2(original_config, config_path)
-
-        # Commit the template and config
-        subprocess.run(["git", "add", "."], cwd=test_repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit with template"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create path for new doc
-        new_doc_path = test_repo / "docs" / "my-requirements.md"
-
-        # Run CLI with --dry-run flag
-        argv = [
-            "--template",
-            str(template_path),
-            "--doc",
-            str(new_doc_path),
-            "--repo-root",
-            str(test_repo),
-            "--dry-run",
-            "--log-level",
-            "WARNING",
-        ]
-
-        # Mock the LLM client and WorkflowRunner
-        with patch("requirements_automation.cli.LLMClient") as mock_llm_class:
-            with patch("requirements_automation.cli.WorkflowRunner") as mock_runner_class:
-                mock_llm = create_mock_llm()
-                mock_llm_class.return_value = mock_llm
-
-                mock_runner = MagicMock()
-                mock_runner_class.return_value = mock_runner
-                mock_result = create_mock_runner_result(changed=False)
-                mock_runner.run_once.return_value = mock_result
-                mock_runner.lines = []
-
-                exit_code = main(argv)
-
-        # Check that CLI succeeded
-        if exit_code != 0:
-            print(f"  ✗ CLI returned exit code {exit_code} (expected 0)")
-            return False
-
-        # In dry-run mode, the file should still exist (template copy happens before dry-run check)
-        # but it shouldn't be committed
-        if not new_doc_path.exists():
-            print(f"  ✗ New document was not created: {new_doc_path}")
-            return False
-
-        # Check that file is untracked (not committed in dry-run)
-        status_after = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=test_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout
-
-        if "??" not in status_after:
-            print(f"  ✗ File should be untracked in dry-run mode, but got: {status_after}")
-            return False
-
-        print("  ✓ Dry-run mode: file created but not committed (as expected)")
-        return True
-
-
-def main_test():
-    """Run all tests."""
-    print("=" * 70)
-    print("CLI Template Creation Test Suite")
-    print("=" * 70)
-
-    tests = [
-        test_template_creation_commits_file,
-        test_template_creation_with_no_commit_flag,
-        test_template_creation_with_dry_run_flag,
-    ]
-
-    results = []
-    for test in tests:
-        try:
-            result = test()
-            results.append(result)
-        except Exception as e:
-            print(f"  ✗ Test failed with exception: {e}")
-            import traceback
-
-            traceback.print_exc()
-            results.append(False)
-
-    print("\n" + "=" * 70)
-    passed = sum(results)
-    total = len(results)
-    print(f"Results: {passed}/{total} tests passed")
-    print("=" * 70)
+    assert not status_after.strip(), (
+        f"Working tree not clean after CLI run (file not committed):\n{status_after}"
+    )
 
-    return 0 if all(results) else 1
+    log_output = _head_subject(test_repo)
+    assert "requirements: initialize from template" in log_output, (
+        f"Commit message doesn't match expected, got: {log_output}"
+    )
 
 
 if __name__ == "__main__":
-    sys.exit(main_test())
+    sys.exit(pytest.main([__file__, "-q"]))
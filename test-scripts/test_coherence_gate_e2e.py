@@ -5,8 +5,11 @@ End-to-end integration test for coherence_check gate with a realistic document.
 This test creates a document similar to the template, processes sections,
 and validates the coherence gate behavior.
 """
+import re
 import sys
+import traceback
 from pathlib import Path
+from typing import Tuple
 
 # Add the tools directory to the path
 repo_root = Path(__file__).parent.parent
@@ -14,144 +17,181 @@ sys.path.insert(0, str(repo_root / "tools"))
 
 from requirements_automation.handler_registry import HandlerRegistry
 from requirements_automation.llm_client import LLMClient
+from requirements_automation.models import HandlerConfig
 from requirements_automation.parsing import (
     extract_workflow_order,
     find_sections,
     get_section_span,
     section_is_locked,
 )
+from requirements_automation.review_gate_handler import ReviewGateHandler
 from requirements_automation.runner_core import WorkflowRunner
 
+# Approval record row updated by the gate (same-line match over the joined document)
+APPROVAL_UPDATE_RE = re.compile(r"^\| Recommended By \|.*requirements-automation", re.MULTILINE)
+
+# Handler registry is read-only in these tests, so both share one instance
+_REGISTRY = HandlerRegistry(repo_root / "tools" / "config" / "handler_registry.yaml")
+
+# Coherence gate config for exercising ReviewGateHandler directly
+_COHERENCE_CONFIG = HandlerConfig(
+    section_id="review_gate:coherence_check",
+    mode="review_gate",
+    output_format="prose",
+    subsections=False,
+    dedupe=False,
+    preserve_headers=[],
+    sanitize_remove=[],
+    llm_profile="requirements_review",
+    auto_apply_patches="never",
+    scope="all_prior_sections",
+    validation_rules=[],
+)
+
+# Clean review response shared by every call; the tests only read it
+_EMPTY_REVIEW = {"issues": [], "patches": [], "summary": "Review passed"}
+
+
+class _MockLLM:
+    """LLM stand-in whose reviews never raise issues."""
+
+    def perform_review(self, gate_id, doc_type, section_contents, llm_profile, validation_rules):
+        return _EMPTY_REVIEW
+
+
+# Realistic document built once at import; callers get a fresh list() copy.
+_TEMPLATE_DOC: Tuple[str, ...] = (
+    '<!-- meta:doc_type value="requirements" -->',
+    '<!-- meta:doc_format value="markdown" version="1.0" -->',
+    '',
+    '<!-- workflow:order',
+    'problem_statement',
+    'goals_objectives',
+    'stakeholders_users',
+    'success_criteria',
+    'assumptions',
+    'constraints',
+    'review_gate:coherence_check',
+    'requirements',
+    '-->',
+    '',
+    '# Requirements Document',
+    '',
+    '## 1. Problem Statement',
+    '<!-- section:problem_statement -->',
+    'We need to build a document automation system that helps teams create and maintain requirements documents.',
+    '',
+    '### Questions & Issues',
+    '<!-- table:problem_statement_questions -->',
+    '| Question ID | Question | Date | Answer | Status |',
+    '|-------------|----------|------|--------|--------|',
+    '| Q1 | What is the primary use case? | 2024-01-01 | Requirements automation | Resolved |',
+    '',
+    '<!-- section_lock:problem_statement lock=false -->',
+    '---',
+    '',
+    '## 2. Goals and Objectives',
+    '<!-- section:goals_objectives -->',
+    '### Primary Goals',
+    '1. Automate requirements document creation',
+    '2. Ensure consistency across documents',
+    '',
+    '### Questions & Issues',
+    '<!-- table:goals_objectives_questions -->',
+    '| Question ID | Question | Date | Answer | Status |',
+    '|-------------|----------|------|--------|--------|',
+    '| Q2 | What is target completion date? | 2024-01-01 | Q2 2024 | Resolved |',
+    '',
+    '<!-- section_lock:goals_objectives lock=false -->',
+    '---',
+    '',
+    '## 3. Stakeholders and Users',
+    '<!-- section:stakeholders_users -->',
+    'Primary stakeholders include development teams and product managers.',
+    '',
+    '### Questions & Issues',
+    '<!-- table:stakeholders_users_questions -->',
+    '| Question ID | Question | Date | Answer | Status |',
+    '|-------------|----------|------|--------|--------|',
+    '| Q3 | Who are the key users? | 2024-01-01 | Dev teams | Resolved |',
+    '',
+    '<!-- section_lock:stakeholders_users lock=false -->',
+    '---',
+    '',
+    '## 4. Success Criteria',
+    '<!-- section:success_criteria -->',
+    '1. Documents can be generated automatically',
+    '2. Quality metrics meet standards',
+    '',
+    '### Questions & Issues',
+    '<!-- table:success_criteria_questions -->',
+    '| Question ID | Question | Date | Answer | Status |',
+    '|-------------|----------|------|--------|--------|',
+    '| Q4 | What are the quality metrics? | 2024-01-01 | Completeness | Resolved |',
+    '',
+    '<!-- section_lock:success_criteria lock=false -->',
+    '---',
+    '',
+    '## 5. Assumptions',
+    '<!-- section:assumptions -->',
+    '- Users have basic markdown knowledge',
+    '- System will run on modern infrastructure',
+    '',
+    '### Questions & Issues',
+    '<!-- table:assumptions_questions -->',
+    '| Question ID | Question | Date | Answer | Status |',
+    '|-------------|----------|------|--------|--------|',
+    '| Q5 | Are these assumptions validated? | 2024-01-01 | Yes | Resolved |',
+    '',
+    '<!-- section_lock:assumptions lock=false -->',
+    '---',
+    '',
+    '## 6. Constraints',
+    '<!-- section:constraints -->',
+    '### Technical Constraints',
+    '- Must work with existing CI/CD pipeline',
+    '- Python 3.9+ required',
+    '',
+    '### Questions & Issues',
+    '<!-- table:constraints_questions -->',
+    '| Question ID | Question | Date | Answer | Status |',
+    '|-------------|----------|------|--------|--------|',
+    '| Q6 | Are constraints feasible? | 2024-01-01 | Yes | Resolved |',
+    '',
+    '<!-- section_lock:constraints lock=false -->',
+    '---',
+    '',
+    '## 10. Identified Risks',
+    '<!-- section:identified_risks -->',
+    '',
+    '<!-- table:risks -->',
+    '| Risk ID | Description | Probability | Impact | Mitigation Strategy | Owner |',
+    '|---------|-------------|-------------|--------|---------------------|-------|',
+    '| R1 | API changes | Low | Low | Version pinning | Team |',
+    '| R2 | Performance issues | Low | Low | Load testing | Team |',
+    '',
+    '<!-- section_lock:identified_risks lock=false -->',
+    '---',
+    '',
+    '## 13. Approval Record',
+    '<!-- section:approval_record -->',
+    '',
+    '<!-- table:approval_record -->',
+    '| Field | Value |',
+    '|-------|-------|',
+    '| Current Status | Draft |',
+    '| Recommended By | Pending |',
+    '| Recommendation Date | Pending |',
+    '| Approved By | Pending |',
+    '| Approval Date | Pending |',
+    '',
+    '---',
+)
+
 
 def create_realistic_test_document() -> list:
     """Create a realistic test document similar to the template."""
-    return [
-        '<!-- meta:doc_type value="requirements" -->',
-        '<!-- meta:doc_format value="markdown" version="1.0" -->',
-        '',
-        '<!-- workflow:order',
-        'problem_statement',
-        'goals_objectives',
-        'stakeholders_users',
-        'success_criteria',
-        'assumptions',
-        'constraints',
-        'review_gate:coherence_check',
-        'requirements',
-        '-->',
-        '',
-        '# Requirements Document',
-        '',
-        '## 1. Problem Statement',
-        '<!-- section:problem_statement -->',
-        'We need to build a document automation system that helps teams create and maintain requirements documents.',
-        '',
-        '### Questions & Issues',
-        '<!-- table:problem_statement_questions -->',
-        '| Question ID | Question | Date | Answer | Status |',
-        '|-------------|----------|------|--------|--------|',
-        '| Q1 | What is the primary use case? | 2024-01-01 | Requirements automation | Resolved |',
-        '',
-        '<!-- section_lock:problem_statement lock=false -->',
-        '---',
-        '',
-        '## 2. Goals and Objectives',
-        '<!-- section:goals_objectives -->',
-        '### Primary Goals',
-        '1. Automate requirements document creation',
-        '2. Ensure consistency across documents',
-        '',
-        '### Questions & Issues',
-        '<!-- table:goals_objectives_questions -->',
-        '| Question ID | Question | Date | Answer | Status |',
-        '|-------------|----------|------|--------|--------|',
-        '| Q2 | What is target completion date? | 2024-01-01 | Q2 2024 | Resolved |',
-        '',
-        '<!-- section_lock:goals_objectives lock=false -->',
-        '---',
-        '',
-        '## 3. Stakeholders and Users',
-        '<!-- section:stakeholders_users -->',
-        'Primary stakeholders include development teams and product managers.',
-        '',
-        '### Questions & Issues',
-        '<!-- table:stakeholders_users_questions -->',
-        '| Question ID | Question | Date | Answer | Status |',
-        '|-------------|----------|------|--------|--------|',
-        '| Q3 | Who are the key users? | 2024-01-01 | Dev teams | Resolved |',
-        '',
-        '<!-- section_lock:stakeholders_users lock=false -->',
-        '---',
-        '',
-        '## 4. Success Criteria',
-        '<!-- section:success_criteria -->',
-        '1. Documents can be generated automatically',
-        '2. Quality metrics meet standards',
-        '',
-        '### Questions & Issues',
-        '<!-- table:success_criteria_questions -->',
-        '| Question ID | Question | Date | Answer | Status |',
-        '|-------------|----------|------|--------|--------|',
-        '| Q4 | What are the quality metrics? | 2024-01-01 | Completeness | Resolved |',
-        '',
-        '<!-- section_lock:success_criteria lock=false -->',
-        '---',
-        '',
-        '## 5. Assumptions',
-        '<!-- section:assumptions -->',
-        '- Users have basic markdown knowledge',
-        '- System will run on modern infrastructure',
-        '',
-        '### Questions & Issues',
-        '<!-- table:assumptions_questions -->',
-        '| Question ID | Question | Date | Answer | Status |',
-        '|-------------|----------|------|--------|--------|',
-        '| Q5 | Are these assumptions validated? | 2024-01-01 | Yes | Resolved |',
-        '',
-        '<!-- section_lock:assumptions lock=false -->',
-        '---',
-        '',
-        '## 6. Constraints',
-        '<!-- section:constraints -->',
-        '### Technical Constraints',
-        '- Must work with existing CI/CD pipeline',
-        '- Python 3.9+ required',
-        '',
-        '### Questions & Issues',
-        '<!-- table:constraints_questions -->',
-        '| Question ID | Question | Date | Answer | Status |',
-        '|-------------|----------|------|--------|--------|',
-        '| Q6 | Are constraints feasible? | 2024-01-01 | Yes | Resolved |',
-        '',
-        '<!-- section_lock:constraints lock=false -->',
-        '---',
-        '',
-        '## 10. Identified Risks',
-        '<!-- section:identified_risks -->',
-        '',
-        '<!-- table:risks -->',
-        '| Risk ID | Description | Probability | Impact | Mitigation Strategy | Owner |',
-        '|---------|-------------|-------------|--------|---------------------|-------|',
-        '| R1 | API changes | Low | Low | Version pinning | Team |',
-        '| R2 | Performance issues | Low | Low | Load testing | Team |',
-        '',
-        '<!-- section_lock:identified_risks lock=false -->',
-        '---',
-        '',
-        '## 13. Approval Record',
-        '<!-- section:approval_record -->',
-        '',
-        '<!-- table:approval_record -->',
-        '| Field | Value |',
-        '|-------|-------|',
-        '| Current Status | Draft |',
-        '| Recommended By | Pending |',
-        '| Recommendation Date | Pending |',
-        '| Approved By | Pending |',
-        '| Approval Date | Pending |',
-        '',
-        '---',
-    ]
+    return list(_TEMPLATE_DOC)
 
 
 def test_e2e_coherence_gate_pass():
@@ -162,29 +202,16 @@ def test_e2e_coherence_gate_pass():
     
     lines = create_realistic_test_document()
     
-    # Mock LLM client
-    class MockLLM:
-        def perform_review(self, gate_id, doc_type, section_contents, llm_profile, validation_rules):
-            return {
-                "issues": [],
-                "patches": [],
-                "summary": "All sections look good"
-            }
-    
-    # Load handler registry
-    config_path = Path(repo_root / "tools" / "config" / "handler_registry.yaml")
-    registry = HandlerRegistry(config_path)
-    
     # Extract workflow order
     workflow_order = extract_workflow_order(lines)
     
     # Create workflow runner
     runner = WorkflowRunner(
         lines=lines,
-        llm=MockLLM(),
+        llm=_MockLLM(),
         doc_type="requirements",
         workflow_order=workflow_order,
-        handler_registry=registry,
+        handler_registry=_REGISTRY,
     )
     
     print("\n1. Initial state check...")
@@ -199,67 +226,52 @@ def test_e2e_coherence_gate_pass():
     print("\n2. Running workflow to coherence_check gate...")
     
     # Run workflow until we reach the coherence gate
-    iterations = 0
-    max_iterations = 20
-    
-    while iterations < max_iterations:
-        result = runner.run_once(dry_run=False)
-        iterations += 1
-        
-        print(f"  Iteration {iterations}: {result.target_id} -> {result.action_taken}")
-        
-        if result.target_id == "review_gate:coherence_check":
-            print(f"\n3. Coherence gate result:")
-            print(f"  - Passed: {not result.blocked}")
-            print(f"  - Changed: {result.changed}")
-            print(f"  - Blocked reasons: {result.blocked_reasons}")
-            
-            if result.blocked:
-                print(f"  ✗ Gate should have passed")
-                return False
-            
-            print("  ✓ Gate passed successfully")
-            
-            # Check if sections were locked
-            print("\n4. Checking section locks...")
-            spans = find_sections(runner.lines)
-            prior_sections = ["problem_statement", "goals_objectives", "stakeholders_users", 
-                            "success_criteria", "assumptions", "constraints"]
-            
-            all_locked = True
-            for section_id in prior_sections:
-                span = get_section_span(spans, section_id)
-                if span and not section_is_locked(runner.lines, span):
-                    print(f"  ✗ Section {section_id} should be locked")
-                    all_locked = False
-            
-            if all_locked:
-                print("  ✓ All prior sections locked")
-            else:
-                return False
-            
-            # Check if approval record was updated
-            print("\n5. Checking approval record update...")
-            found_update = False
-            for line in runner.lines:
-                if "| Recommended By |" in line and "requirements-automation" in line:
-                    found_update = True
-                    break
-            
-            if found_update:
-                print("  ✓ Approval record updated")
-            else:
-                print("  ✗ Approval record should be updated")
-                return False
-            
-            return True
-        
-        if result.action_taken == "complete":
-            print("  ✗ Workflow completed without reaching coherence gate")
-            return False
-    
-    print(f"  ✗ Max iterations ({max_iterations}) reached")
-    return False
+    result = runner.run_until("review_gate:coherence_check", max_steps=20)
+    
+    if result is None:
+        print("  ✗ Workflow stopped before reaching coherence gate")
+        return False
+    
+    print(f"\n3. Coherence gate result:")
+    print(f"  - Passed: {not result.blocked}")
+    print(f"  - Changed: {result.changed}")
+    print(f"  - Blocked reasons: {result.blocked_reasons}")
+    
+    if result.blocked:
+        print(f"  ✗ Gate should have passed")
+        return False
+    
+    print("  ✓ Gate passed successfully")
+    
+    # Check if sections were locked
+    print("\n4. Checking section locks...")
+    spans = find_sections(runner.lines)
+    # Reversed so the first marker wins, matching get_section_span
+    span_by_id = {sp.section_id: sp for sp in reversed(spans)}
+    prior_sections = ["problem_statement", "goals_objectives", "stakeholders_users",
+                      "success_criteria", "assumptions", "constraints"]
+    
+    all_locked = True
+    for section_id in prior_sections:
+        span = span_by_id.get(section_id)
+        if span and not section_is_locked(runner.lines, span):
+            print(f"  ✗ Section {section_id} should be locked")
+            all_locked = False
+    
+    if all_locked:
+        print("  ✓ All prior sections locked")
+    else:
+        return False
+    
+    # Check if approval record was updated
+    print("\n5. Checking approval record update...")
+    if APPROVAL_UPDATE_RE.search("\n".join(runner.lines)):
+        print("  ✓ Approval record updated")
+    else:
+        print("  ✗ Approval record should be updated")
+        return False
+    
+    return True
 
 
 def test_e2e_coherence_gate_blocked():
@@ -278,45 +290,15 @@ def test_e2e_coherence_gate_blocked():
             lines.insert(i + 1, '| Q1-new | Is this approach correct? | 2024-01-02 | | Open |')
             break
     
-    # Mock LLM client
-    class MockLLM:
-        def perform_review(self, gate_id, doc_type, section_contents, llm_profile, validation_rules):
-            return {
-                "issues": [],
-                "patches": [],
-                "summary": "Review passed"
-            }
-    
-    # Load handler registry
-    config_path = Path(repo_root / "tools" / "config" / "handler_registry.yaml")
-    registry = HandlerRegistry(config_path)
-    
     # Extract workflow order
     workflow_order = extract_workflow_order(lines)
     
     # Since we're testing just the gate behavior, let's directly test it
-    from requirements_automation.review_gate_handler import ReviewGateHandler
-    from requirements_automation.models import HandlerConfig
-    
     print("\n1. Testing coherence gate directly with open question...")
     
-    handler = ReviewGateHandler(MockLLM(), lines, "requirements")
-    
-    config = HandlerConfig(
-        section_id="review_gate:coherence_check",
-        mode="review_gate",
-        output_format="prose",
-        subsections=False,
-        dedupe=False,
-        preserve_headers=[],
-        sanitize_remove=[],
-        llm_profile="requirements_review",
-        auto_apply_patches="never",
-        scope="all_prior_sections",
-        validation_rules=[],
-    )
+    handler = ReviewGateHandler(_MockLLM(), lines, "requirements")
     
-    result = handler.execute_review("review_gate:coherence_check", config)
+    result = handler.execute_review("review_gate:coherence_check", _COHERENCE_CONFIG)
     
     print(f"\n2. Coherence gate result:")
     print(f"  - Passed: {result.passed}")
@@ -326,7 +308,8 @@ def test_e2e_coherence_gate_blocked():
         print(f"  ✗ Gate should have been blocked")
         return False
     
-    if not any("open question" in issue.description.lower() for issue in result.issues):
+    issue_text = " | ".join(issue.description for issue in result.issues).lower()
+    if "open question" not in issue_text:
         print(f"  ✗ Should mention open questions in issues")
         print(f"  Issues: {[i.description for i in result.issues]}")
         return False
@@ -365,7 +348,6 @@ def main():
                 failed += 1
         except Exception as e:
             print(f"  ✗ Test failed with exception: {e}")
-            import traceback
             traceback.print_exc()
             failed += 1
     
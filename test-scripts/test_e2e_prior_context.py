@@ -7,20 +7,92 @@ This test verifies that:
 2. LLM calls for later sections include prior context
 3. Generated questions reference specific details from earlier sections
 """
-import shutil
+import functools
+import re
 import sys
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-import yaml
+import pytest
 
-# Add the tools directory to the path
+# Add the tools directory to the path (already done by the root conftest under pytest;
+# kept, guarded, so the module still imports when run as a script)
 repo_root = Path(__file__).parent.parent
-sys.path.insert(0, str(repo_root / "tools"))
+_tools_dir = str(repo_root / "tools")
+if _tools_dir not in sys.path:
+    sys.path.insert(0, _tools_dir)
 
 from requirements_automation.cli import main as cli_main
-from requirements_automation.utils_io import read_text, write_text
+from requirements_automation.llm import LLMClient
+
+# The scope: line of the requirements section inside the top-level requirements doc type.
+# Stays within indented lines so the _default handler's requirements entry is never touched.
+REQUIREMENTS_SCOPE_RE = re.compile(
+    r"(^requirements:\n(?:(?:[ \t].*)?\n)*?"
+    r"  requirements:\n(?:(?:    .*|[ \t]*)\n)*?"
+    r"    scope:[ \t]*)\S+",
+    re.MULTILINE,
+)
+
+
+# Prompt snippets the context checks look for, matched together in one scan per prompt
+CONTEXT_HEADER = "## Previously Completed Sections"
+PROBLEM_STATEMENT_HEADING = "### Problem Statement"
+CONSTRAINTS_HEADING = "### Constraints"
+GITHUB_CONTEXT_TOKENS = (
+    CONTEXT_HEADER,
+    PROBLEM_STATEMENT_HEADING,
+    "GitHub API",
+    "issues and pull requests",
+    CONSTRAINTS_HEADING,
+    "5000 requests per hour",
+    "OAuth tokens",
+    "5 seconds",
+)
+IOT_QUALITY_CHECKS = {
+    "IoT sensors": "Mentions IoT sensors from problem_statement",
+    "10,000": "References device count from problem_statement",
+    "sub-second": "References latency goal from goals_objectives",
+    "99.9%": "References uptime SLA from goals_objectives",
+    "MQTT": "References MQTT protocol from constraints",
+    "90 days": "References data retention from constraints",
+    "$5,000": "References budget constraint",
+}
+
+
+def _token_scanner(tokens):
+    """
+    Compile one pattern that reports every token occurrence in a single pass.
+
+    The alternation sits in a lookahead so matches may overlap, and longer
+    tokens are tried first so a shared prefix never hides the longer token.
+    """
+    alternation = "|".join(map(re.escape, sorted(tokens, key=len, reverse=True)))
+    return re.compile(f"(?=({alternation}))")
+
+
+GITHUB_CONTEXT_RE = _token_scanner(GITHUB_CONTEXT_TOKENS)
+IOT_QUALITY_RE = _token_scanner(IOT_QUALITY_CHECKS)
+
+
+def _tokens_found(scanner, text):
+    """Return the set of tokens that scanner finds anywhere in text."""
+    return {m.group(1) for m in scanner.finditer(text)}
+
+
+@functools.lru_cache(maxsize=8)
+def _all_prior_sections_registry_yaml(path_str, mtime_ns):
+    """
+    Render the handler registry with requirements scope set to all_prior_sections.
+
+    Only the one scope value is rewritten in the raw text, so there is no YAML
+    parse or dump and the copy keeps the source's comments and layout. Memoized
+    by (path, mtime) so edits to the file on disk still invalidate it.
+    """
+    with open(path_str, "r") as f:
+        content = f.read()
+
+    return REQUIREMENTS_SCOPE_RE.sub(r"\g<1>all_prior_sections", content, count=1)
 
 
 def setup_test_config_with_all_prior_sections_scope(tmpdir_path):
@@ -28,37 +100,90 @@ def setup_test_config_with_all_prior_sections_scope(tmpdir_path):
     Helper function to setup handler registry with modified scope.
 
     Creates a copy of the handler registry and modifies the requirements
-    section to use scope: all_prior_sections for testing.
+    section to use scope: all_prior_sections for testing. The copy is placed
+    where the CLI looks for it when run with --repo-root tmpdir_path.
 
     Args:
         tmpdir_path: Path to temporary directory
     """
-    config_dir = tmpdir_path / "config"
-    config_dir.mkdir(exist_ok=True)
-    registry_src = repo_root / "config" / "handler_registry.yaml"
+    config_dir = tmpdir_path / "tools" / "config"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    registry_src = repo_root / "tools" / "config" / "handler_registry.yaml"
     registry_dst = config_dir / "handler_registry.yaml"
 
-    # Parse YAML, modify, and write back
-    with open(registry_src, "r") as f:
-        config_data = yaml.safe_load(f)
+    registry_dst.write_text(
+        _all_prior_sections_registry_yaml(str(registry_src), registry_src.stat().st_mtime_ns)
+    )
 
-    # Modify the requirements section scope
-    if "requirements" in config_data and "requirements" in config_data["requirements"]:
-        config_data["requirements"]["requirements"]["scope"] = "all_prior_sections"
+    return registry_dst
 
-    with open(registry_dst, "w") as f:
-        yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
 
-    return registry_dst
+@pytest.fixture(scope="module")
+def work_root(tmp_path_factory):
+    """
+    Temporary repo root shared by every CLI run in this module.
 
+    The modified handler registry is written here once and every run passes
+    this directory as --repo-root; each test keeps its document in its own
+    tmp_path, so runs stay isolated without a registry copy per test. Under
+    pytest-xdist (``pytest -n auto``) each worker builds its own root.
+    """
+    root = tmp_path_factory.mktemp("e2e", numbered=True)
 
-def test_cli_with_prior_context():
-    """Test CLI processes document with prior context included in LLM calls."""
-    print("Integration Test: CLI with Prior Context")
-    print("=" * 70)
+    # Setup test config with modified scope
+    setup_test_config_with_all_prior_sections_scope(root)
+    return root
+
+
+def run_cli_capturing_prompts(work_root, doc_path, doc_bytes, llm_response):
+    """
+    Run the CLI once in dry-run mode against doc_bytes with a mocked LLM.
+
+    Both tests share this harness: the module's temporary repo root with the
+    all_prior_sections registry, and one patch of LLMClient for the whole run.
 
-    # Create a test document with completed early sections and blank requirements
-    test_doc = """<!-- meta:doc_type value="requirements" -->
+    Args:
+        work_root: Repo root holding the all_prior_sections handler registry
+        doc_path: Where to write the document (inside the test's tmp_path)
+        doc_bytes: UTF-8 encoded document content to process
+        llm_response: Raw text the mocked LLM returns for every call
+
+    Returns:
+        Tuple of (CLI exit code, list of prompts sent to the LLM)
+    """
+    captured_prompts = []
+
+    def mock_llm_call(prompt):
+        """Mock LLM call that captures the prompt."""
+        captured_prompts.append(prompt)
+        return llm_response
+
+    doc_path.write_bytes(doc_bytes)
+
+    argv = [
+        "--template",
+        str(doc_path),  # Use the doc itself as template for simplicity
+        "--doc",
+        str(doc_path),
+        "--repo-root",
+        str(work_root),
+        "--dry-run",  # Don't actually modify the file
+        "--no-commit",  # Don't require git
+    ]
+
+    with patch.object(LLMClient, "_call", side_effect=mock_llm_call), patch.object(
+        LLMClient, "_make_client"
+    ):
+        try:
+            result = cli_main(argv)
+        except SystemExit as e:
+            result = e.code
+
+    return result, captured_prompts
+
+
+# Test document with completed early sections and blank requirements
+TEST_DOC_GITHUB = """<!-- meta:doc_type value="requirements" -->
 <!-- workflow:order
 problem_statement
 constraints
@@ -100,137 +225,10 @@ We need to build a GitHub API integration that syncs issues and pull requests to
 |-------------|----------|------|--------|----------------|-------------------|
 """
 
-    # Create temporary directory for test
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        doc_path = tmpdir_path / "test_requirements.md"
-
-        # Setup test config with modified scope
-        setup_test_config_with_all_prior_sections_scope(tmpdir_path)
-
-        # Write test document
-        write_text(doc_path, test_doc)
-        print(f"  Created test document: {doc_path}")
-        print(f"  Modified handler config to use scope: all_prior_sections for requirements")
-
-        # Track LLM calls to verify prior context is included
-        llm_calls = []
-
-        def mock_llm_call(prompt):
-            """Mock LLM call that captures the prompt."""
-            llm_calls.append(prompt)
-            # Return sample questions that reference prior context
-            return """{
-                "questions": [
-                    {
-                        "question": "Should the GitHub API integration support webhook endpoints for real-time updates, or rely on polling within the 5-second processing constraint?",
-                        "section_target": "requirements",
-                        "rationale": "Need to clarify real-time requirements given the resource constraints"
-                    },
-                    {
-                        "question": "What OAuth scope is required for the GitHub authentication tokens to access issues and pull requests?",
-                        "section_target": "requirements",
-                        "rationale": "Need to define specific API permissions"
-                    },
-                    {
-                        "question": "How should the system handle GitHub API rate limiting (5000 requests/hour)?",
-                        "section_target": "requirements",
-                        "rationale": "Need strategy for staying within API constraints"
-                    }
-                ]
-            }"""
-
-        # Patch the LLM client's _call method
-        with patch("requirements_automation.llm.LLMClient._call", side_effect=mock_llm_call):
-            with patch("requirements_automation.llm.LLMClient._make_client"):
-                # Run CLI
-                print("  Running CLI...")
-                sys.argv = [
-                    "cli.py",
-                    "--template",
-                    str(doc_path),  # Use the doc itself as template for simplicity
-                    "--doc",
-                    str(doc_path),
-                    "--repo-root",
-                    str(tmpdir_path),
-                    "--dry-run",  # Don't actually modify the file
-                    "--no-commit",  # Don't require git
-                ]
-
-                try:
-                    result = cli_main()
-                    print(f"  CLI completed with result: {result}")
-                except SystemExit as e:
-                    result = e.code
-                    print(f"  CLI exited with code: {result}")
-
-        # Verify LLM was called
-        if not llm_calls:
-            print("  ✗ No LLM calls made")
-            return False
-
-        print(f"\n  LLM was called {len(llm_calls)} time(s)")
-
-        # Check if any call includes document context
-        has_context = False
-        context_details = []
-
-        for i, prompt in enumerate(llm_calls):
-            print(f"\n  Analyzing LLM call {i+1}...")
-
-            # Check for Document Context header
-            if "## Document Context (completed sections)" in prompt:
-                has_context = True
-                print("    ✓ Contains 'Document Context' header")
-
-                # Check for specific prior section content
-                if "### problem_statement" in prompt:
-                    print("    ✓ Includes problem_statement section")
-                    context_details.append("problem_statement")
-
-                    # Check for specific content from problem_statement
-                    if "GitHub API" in prompt:
-                        print("    ✓ References 'GitHub API' from problem_statement")
-                    if "issues and pull requests" in prompt:
-                        print("    ✓ References 'issues and pull requests' from problem_statement")
-
-                if "### constraints" in prompt:
-                    print("    ✓ Includes constraints section")
-                    context_details.append("constraints")
-
-                    # Check for specific content from constraints
-                    if "5000 requests per hour" in prompt:
-                        print("    ✓ References API rate limit from constraints")
-                    if "OAuth tokens" in prompt:
-                        print("    ✓ References OAuth authentication from constraints")
-                    if "5 seconds" in prompt:
-                        print("    ✓ References processing time constraint")
-            else:
-                print("    ⚠ Does not contain Document Context")
-
-        # Verify results
-        print(f"\n  Summary:")
-        if has_context:
-            print(f"    ✓ LLM calls included prior context")
-            print(f"    ✓ Prior sections included: {', '.join(context_details)}")
-            return True
-        else:
-            print(f"    ✗ No LLM calls included prior context")
-            print(f"    ℹ This might be expected if the handler config has scope: current_section")
-            # Check if it's actually a failure or expected behavior
-            # For requirements section, check the handler config
-            return False
-
-
-def test_question_quality_with_prior_context():
-    """Test that questions reference specific details from prior sections."""
-    print("\nIntegration Test: Question Quality with Prior Context")
-    print("=" * 70)
-
-    # This test verifies that when prior context is provided, the questions
-    # generated are more targeted and reference specific details
 
-    test_doc = """<!-- meta:doc_type value="requirements" -->
+# Richer document for question quality: when prior context is provided, the
+# questions generated should be more targeted and reference specific details
+TEST_DOC_IOT = """<!-- meta:doc_type value="requirements" -->
 <!-- workflow:order
 problem_statement
 goals_objectives
@@ -281,132 +279,101 @@ We need a real-time data synchronization system for IoT sensors that collects te
 |-------------|----------|------|--------|----------------|-------------------|
 """
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        doc_path = tmpdir_path / "test_iot_requirements.md"
-
-        # Setup test config with modified scope
-        setup_test_config_with_all_prior_sections_scope(tmpdir_path)
-
-        write_text(doc_path, test_doc)
-        print(f"  Created test document: {doc_path}")
-        print(f"  Modified handler config to use scope: all_prior_sections for requirements")
-
-        # Track the prompt to verify it includes specific details
-        captured_prompts = []
-
-        def mock_llm_call(prompt):
-            """Mock LLM call that captures the prompt."""
-            captured_prompts.append(prompt)
-            # Return contextual questions that reference prior sections
-            return """{
-                "questions": [
-                    {
-                        "question": "How should the MQTT broker architecture scale to support 50,000 IoT devices while maintaining sub-second latency for critical temperature alerts?",
-                        "section_target": "requirements",
-                        "rationale": "Combines scalability goal with MQTT constraint and latency requirement"
-                    },
-                    {
-                        "question": "What temperature/humidity thresholds should trigger critical alerts requiring sub-second latency?",
-                        "section_target": "requirements",
-                        "rationale": "Defines what constitutes a critical alert from sensor readings"
-                    },
-                    {
-                        "question": "How will the 90-day data retention policy be implemented while maintaining historical trend analysis capabilities?",
-                        "section_target": "requirements",
-                        "rationale": "Addresses compliance constraint from constraints section"
-                    }
-                ]
-            }"""
-
-        with patch("requirements_automation.llm.LLMClient._call", side_effect=mock_llm_call):
-            with patch("requirements_automation.llm.LLMClient._make_client"):
-                sys.argv = [
-                    "cli.py",
-                    "--template",
-                    str(doc_path),  # Use the doc itself as template for simplicity
-                    "--doc",
-                    str(doc_path),
-                    "--repo-root",
-                    str(tmpdir_path),
-                    "--dry-run",
-                    "--no-commit",  # Don't require git
-                ]
-
-                try:
-                    result = cli_main()
-                except SystemExit as e:
-                    result = e.code
-
-        if not captured_prompts:
-            print("  ✗ No prompts captured")
-            return False
-
-        # Analyze the prompt for quality indicators
-        prompt = captured_prompts[0]  # Check the first/main prompt
-
-        print(f"\n  Analyzing prompt for context-aware question generation...")
-
-        quality_checks = {
-            "IoT sensors": "Mentions IoT sensors from problem_statement",
-            "10,000": "References device count from problem_statement",
-            "sub-second": "References latency goal from goals_objectives",
-            "99.9%": "References uptime SLA from goals_objectives",
-            "MQTT": "References MQTT protocol from constraints",
-            "90 days": "References data retention from constraints",
-            "$5,000": "References budget constraint",
-        }
-
-        passed_checks = 0
-        for detail, description in quality_checks.items():
-            if detail in prompt:
-                print(f"    ✓ {description}")
-                passed_checks += 1
-            else:
-                print(f"    ⚠ Missing: {description}")
-
-        print(f"\n  Quality score: {passed_checks}/{len(quality_checks)} context details present")
-
-        # Consider test passed if at least half the details are present
-        if passed_checks >= len(quality_checks) // 2:
-            print(f"  ✓ Prompt includes sufficient prior context details")
-            return True
-        else:
-            print(f"  ✗ Prompt lacks sufficient prior context details")
-            return False
+# Encoded once at import; the CLI reads documents back as UTF-8 text
+TEST_DOC_GITHUB_BYTES = TEST_DOC_GITHUB.encode("utf-8")
+TEST_DOC_IOT_BYTES = TEST_DOC_IOT.encode("utf-8")
 
 
-def main():
-    """Run all integration tests."""
-    print("=" * 70)
-    print("End-to-End Integration Test Suite")
-    print("Prior-Context-Enabled Requirements Drafting")
-    print("=" * 70)
-
-    tests = [
-        test_cli_with_prior_context,
-        test_question_quality_with_prior_context,
+def test_cli_with_prior_context(work_root, tmp_path):
+    """Test CLI processes document with prior context included in LLM calls."""
+    # Sample questions that reference prior context
+    llm_response = """{
+        "questions": [
+            {
+                "question": "Should the GitHub API integration support webhook endpoints for real-time updates, or rely on polling within the 5-second processing constraint?",
+                "section_target": "requirements",
+                "rationale": "Need to clarify real-time requirements given the resource constraints"
+            },
+            {
+                "question": "What OAuth scope is required for the GitHub authentication tokens to access issues and pull requests?",
+                "section_target": "requirements",
+                "rationale": "Need to define specific API permissions"
+            },
+            {
+                "question": "How should the system handle GitHub API rate limiting (5000 requests/hour)?",
+                "section_target": "requirements",
+                "rationale": "Need strategy for staying within API constraints"
+            }
+        ]
+    }"""
+
+    result, llm_calls = run_cli_capturing_prompts(
+        work_root, tmp_path / "test_requirements.md", TEST_DOC_GITHUB_BYTES, llm_response
+    )
+
+    assert llm_calls, f"No LLM calls made (CLI result: {result})"
+
+    # Only prompts carrying the prior-sections header count as having context
+    with_context = [
+        found
+        for found in (_tokens_found(GITHUB_CONTEXT_RE, prompt) for prompt in llm_calls)
+        if CONTEXT_HEADER in found
     ]
+    assert with_context, (
+        f"None of the {len(llm_calls)} LLM call(s) included prior context; "
+        "check that the requirements handler uses scope: all_prior_sections"
+    )
 
-    results = []
-    for test in tests:
-        try:
-            result = test()
-            results.append(result)
-        except Exception as e:
-            print(f"\n  ✗ Test failed with exception: {e}")
-            import traceback
-
-            traceback.print_exc()
-            results.append(False)
-
-    print("\n" + "=" * 70)
-    passed = sum(results)
-    total = len(results)
-    print(f"Results: {passed}/{total} tests passed")
-    print("=" * 70)
-
-    return 0 if all(results) else 1
+    missing = set(GITHUB_CONTEXT_TOKENS) - set().union(*with_context)
+    assert not missing, f"Prior context is missing details: {sorted(missing)}"
+
+
+def test_question_quality_with_prior_context(work_root, tmp_path):
+    """Test that questions reference specific details from prior sections."""
+    # Contextual questions that reference prior sections
+    llm_response = """{
+        "questions": [
+            {
+                "question": "How should the MQTT broker architecture scale to support 50,000 IoT devices while maintaining sub-second latency for critical temperature alerts?",
+                "section_target": "requirements",
+                "rationale": "Combines scalability goal with MQTT constraint and latency requirement"
+            },
+            {
+                "question": "What temperature/humidity thresholds should trigger critical alerts requiring sub-second latency?",
+                "section_target": "requirements",
+                "rationale": "Defines what constitutes a critical alert from sensor readings"
+            },
+            {
+                "question": "How will the 90-day data retention policy be implemented while maintaining historical trend analysis capabilities?",
+                "section_target": "requirements",
+                "rationale": "Addresses compliance constraint from constraints section"
+            }
+        ]
+    }"""
+
+    result, captured_prompts = run_cli_capturing_prompts(
+        work_root, tmp_path / "test_iot_requirements.md", TEST_DOC_IOT_BYTES, llm_response
+    )
+
+    assert captured_prompts, f"No prompts captured (CLI result: {result})"
+
+    # Analyze the first/main prompt for quality indicators
+    found = _tokens_found(IOT_QUALITY_RE, captured_prompts[0])
+    missing = [
+        description for detail, description in IOT_QUALITY_CHECKS.items() if detail not in found
+    ]
+    present = len(IOT_QUALITY_CHECKS) - len(missing)
+
+    # Consider test passed if at least half the details are present
+    assert present >= len(IOT_QUALITY_CHECKS) // 2, (
+        f"Prompt lacks sufficient prior context details "
+        f"({present}/{len(IOT_QUALITY_CHECKS)} present); missing: {missing}"
+    )
+
+
+def main():
+    """Run the integration tests in this module under pytest."""
+    return pytest.main([__file__, "-q"])
 
 
 if __name__ == "__main__":
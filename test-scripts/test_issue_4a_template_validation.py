@@ -21,17 +21,10 @@ sys.path.insert(0, str(repo_root / "tools"))
 from requirements_automation.cli import main
 from requirements_automation.utils_io import read_text, split_lines
 
-
-def test_missing_markers_detected():
-    """Test that missing markers are detected when auto-repair is not possible."""
-    print("\nTest: Missing markers detection...")
-    print("=" * 70)
-
-    # Create a template with various markers
-    template_content = """<!-- meta:doc_type value="requirements" -->
+# Fixture bodies shared by several tests, defined once at import
+_SECTION_A_TEMPLATE = """<!-- meta:doc_type value="requirements" -->
 <!-- workflow:order
 section_a
-section_b
 -->
 
 <!-- section:section_a -->
@@ -45,6 +38,18 @@ Sub content
 |------|------|
 | V1   | V2   |
 <!-- section_lock:section_a lock=false -->
+"""
+
+_SECTIONS_A_B_DOC = """<!-- meta:doc_type value="requirements" -->
+<!-- workflow:order
+section_a
+section_b
+-->
+
+<!-- section:section_a -->
+## Section A
+Content A
+<!-- section_lock:section_a lock=false -->
 
 <!-- section:section_b -->
 ## Section B
@@ -52,8 +57,14 @@ Content B
 <!-- section_lock:section_b lock=false -->
 """
 
-    # Create a document missing some markers
-    doc_content = """<!-- meta:doc_type value="requirements" -->
+
+def test_missing_markers_detected():
+    """Test that missing markers are detected when auto-repair is not possible."""
+    print("\nTest: Missing markers detection...")
+    print("=" * 70)
+
+    # Create a template with various markers
+    template_content = """<!-- meta:doc_type value="requirements" -->
 <!-- workflow:order
 section_a
 section_b
@@ -62,6 +73,13 @@ section_b
 <!-- section:section_a -->
 ## Section A
 Content A
+<!-- subsection:sub_a1 -->
+### Subsection A1
+Sub content
+<!-- table:table_a1 -->
+| Col1 | Col2 |
+|------|------|
+| V1   | V2   |
 <!-- section_lock:section_a lock=false -->
 
 <!-- section:section_b -->
@@ -70,6 +88,9 @@ Content B
 <!-- section_lock:section_b lock=false -->
 """
 
+    # Create a document missing some markers
+    doc_content = _SECTIONS_A_B_DOC
+
     with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
         f.write(template_content)
         template_path = Path(f.name)
@@ -126,23 +147,7 @@ def test_complete_document_passes():
     print("=" * 70)
 
     # Create a complete template
-    template_content = """<!-- meta:doc_type value="requirements" -->
-<!-- workflow:order
-section_a
--->
-
-<!-- section:section_a -->
-## Section A
-Content A
-<!-- subsection:sub_a1 -->
-### Subsection A1
-Sub content
-<!-- table:table_a1 -->
-| Col1 | Col2 |
-|------|------|
-| V1   | V2   |
-<!-- section_lock:section_a lock=false -->
-"""
+    template_content = _SECTION_A_TEMPLATE
 
     # Create a matching document
     doc_content = template_content
@@ -188,22 +193,7 @@ def test_missing_section_detected():
     print("=" * 70)
 
     # Create a template with a section
-    template_content = """<!-- meta:doc_type value="requirements" -->
-<!-- workflow:order
-section_a
-section_b
--->
-
-<!-- section:section_a -->
-## Section A
-Content A
-<!-- section_lock:section_a lock=false -->
-
-<!-- section:section_b -->
-## Section B
-Content B
-<!-- section_lock:section_b lock=false -->
-"""
+    template_content = _SECTIONS_A_B_DOC
 
     # Create a document missing section_b
     doc_content = """<!-- meta:doc_type value="requirements" -->
@@ -268,23 +258,7 @@ def test_auto_repair_preserves_existing_content():
     print("=" * 70)
 
     # Create a template
-    template_content = """<!-- meta:doc_type value="requirements" -->
-<!-- workflow:order
-section_a
--->
-
-<!-- section:section_a -->
-## Section A
-Content A
-<!-- subsection:sub_a1 -->
-### Subsection A1
-Sub content
-<!-- table:table_a1 -->
-| Col1 | Col2 |
-|------|------|
-| V1   | V2   |
-<!-- section_lock:section_a lock=false -->
-"""
+    template_content = _SECTION_A_TEMPLATE
 
     # Create a document with existing content
     doc_content = """<!-- meta:doc_type value="requirements" -->
@@ -15,51 +15,94 @@ sys.path.insert(0, str(repo_root / "tools"))
 from requirements_automation.versioning import update_document_version
 
 
+# Document fixtures are built once at import; tests take list() copies.
+_MULTI_TABLE_DOC = (
+    '<!-- meta:doc_type value="requirements" -->',
+    '<!-- meta:version -->',
+    '- **Version:** 0.0',
+    '',
+    '<!-- table:document_control -->',
+    '| Field | Value |',
+    '|-------|-------|',
+    '| Current Version | 0.0 |',
+    '',
+    '<!-- subsection:version_history -->',
+    '### Version History',
+    '| Version | Date | Author | Changes |',
+    '|---------|------|--------|---------|',
+    '| <!-- PLACEHOLDER --> | - | - | - |',
+    '',
+    '<!-- section:stakeholders_users -->',
+    '## Stakeholders and Users',
+    '',
+    '<!-- subsection:primary_stakeholders -->',
+    '### Primary Stakeholders',
+    '| Stakeholder | Role | Interest/Need | Contact |',
+    '|-------------|------|---------------|---------|',
+    '| <!-- PLACEHOLDER --> | - | - | - |',
+    '',
+    '<!-- subsection:end_users -->',
+    '### End Users',
+    '| User Type | Characteristics | Needs | Use Cases |',
+    '|-----------|----------------|-------|-----------|',
+    '| <!-- PLACEHOLDER --> | - | - | - |',
+    '',
+    '<!-- section:constraints -->',
+    '## Constraints',
+    '',
+    '<!-- subsection:technical_constraints -->',
+    '### Technical Constraints',
+    '| <!-- PLACEHOLDER --> | - | - | - |',
+    '',
+    '<!-- subsection:operational_constraints -->',
+    '### Operational Constraints',
+    '| <!-- PLACEHOLDER --> | - | - | - |',
+    '',
+)
+
+_SINGLE_ENTRY_DOC = (
+    '<!-- meta:version -->',
+    '- **Version:** 0.1',
+    '',
+    '<!-- subsection:version_history -->',
+    '### Version History',
+    '| Version | Date | Author | Changes |',
+    '|---------|------|--------|---------|',
+    '| 0.1 | 2026-02-12 | requirements-automation | Initial version |',
+    '',
+    '<!-- section:stakeholders_users -->',
+    '## Stakeholders',
+    '| <!-- PLACEHOLDER --> | - | - | - |',
+)
+
+_DUPLICATE_DOC = (
+    '<!-- meta:version -->',
+    '- **Version:** 0.1',
+    '',
+    '<!-- subsection:version_history -->',
+    '### Version History',
+    '| Version | Date | Author | Changes |',
+    '|---------|------|--------|---------|',
+    '| 0.1 | 2026-02-12 | requirements-automation | Initial version |',
+    '',
+)
+
+_DUPLICATE_SPACED_DOC = (
+    '<!-- meta:version -->',
+    '- **Version:** 0.1',
+    '',
+    '<!-- subsection:version_history -->',
+    '### Version History',
+    '| Version | Date | Author | Changes |',
+    '|---------|------|--------|---------|',
+    '|  0.1  | 2026-02-12 | requirements-automation | Initial version |',  # Extra spaces
+    '',
+)
+
+
 def create_document_with_multiple_tables():
     """Create a test document with version history and other tables with placeholders."""
-    return [
-        '<!-- meta:doc_type value="requirements" -->',
-        '<!-- meta:version -->',
-        '- **Version:** 0.0',
-        '',
-        '<!-- table:document_control -->',
-        '| Field | Value |',
-        '|-------|-------|',
-        '| Current Version | 0.0 |',
-        '',
-        '<!-- subsection:version_history -->',
-        '### Version History',
-        '| Version | Date | Author | Changes |',
-        '|---------|------|--------|---------|',
-        '| <!-- PLACEHOLDER --> | - | - | - |',
-        '',
-        '<!-- section:stakeholders_users -->',
-        '## Stakeholders and Users',
-        '',
-        '<!-- subsection:primary_stakeholders -->',
-        '### Primary Stakeholders',
-        '| Stakeholder | Role | Interest/Need | Contact |',
-        '|-------------|------|---------------|---------|',
-        '| <!-- PLACEHOLDER --> | - | - | - |',
-        '',
-        '<!-- subsection:end_users -->',
-        '### End Users',
-        '| User Type | Characteristics | Needs | Use Cases |',
-        '|-----------|----------------|-------|-----------|',
-        '| <!-- PLACEHOLDER --> | - | - | - |',
-        '',
-        '<!-- section:constraints -->',
-        '## Constraints',
-        '',
-        '<!-- subsection:technical_constraints -->',
-        '### Technical Constraints',
-        '| <!-- PLACEHOLDER --> | - | - | - |',
-        '',
-        '<!-- subsection:operational_constraints -->',
-        '### Operational Constraints',
-        '| <!-- PLACEHOLDER --> | - | - | - |',
-        '',
-    ]
+    return list(_MULTI_TABLE_DOC)
 
 
 def test_bug_reproduction():
@@ -169,20 +212,7 @@ def test_append_behavior():
     print()
     
     # Create document with one existing entry (no placeholder)
-    lines = [
-        '<!-- meta:version -->',
-        '- **Version:** 0.1',
-        '',
-        '<!-- subsection:version_history -->',
-        '### Version History',
-        '| Version | Date | Author | Changes |',
-        '|---------|------|--------|---------|',
-        '| 0.1 | 2026-02-12 | requirements-automation | Initial version |',
-        '',
-        '<!-- section:stakeholders_users -->',
-        '## Stakeholders',
-        '| <!-- PLACEHOLDER --> | - | - | - |',
-    ]
+    lines = list(_SINGLE_ENTRY_DOC)
     
     # Add another version
     print("Adding version 0.2...")
@@ -221,17 +251,7 @@ def test_duplicate_prevention():
     print("=" * 70)
     print()
 
-    lines = [
-        '<!-- meta:version -->',
-        '- **Version:** 0.1',
-        '',
-        '<!-- subsection:version_history -->',
-        '### Version History',
-        '| Version | Date | Author | Changes |',
-        '|---------|------|--------|---------|',
-        '| 0.1 | 2026-02-12 | requirements-automation | Initial version |',
-        '',
-    ]
+    lines = list(_DUPLICATE_DOC)
 
     # Try to add same version again
     print("Attempting to add duplicate version 0.1...")
@@ -249,17 +269,7 @@ def test_duplicate_prevention():
 
     # Test with extra spacing
     print("Testing duplicate prevention with extra spacing...")
-    lines2 = [
-        '<!-- meta:version -->',
-        '- **Version:** 0.1',
-        '',
-        '<!-- subsection:version_history -->',
-        '### Version History',
-        '| Version | Date | Author | Changes |',
-        '|---------|------|--------|---------|',
-        '|  0.1  | 2026-02-12 | requirements-automation | Initial version |',  # Extra spaces
-        '',
-    ]
+    lines2 = list(_DUPLICATE_SPACED_DOC)
 
     lines2 = update_document_version(lines2, "0.1", "Duplicate with spacing")
     content2 = "\n".join(lines2)
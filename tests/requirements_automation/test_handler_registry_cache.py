@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for HandlerRegistry YAML caching.
+
+Repeated HandlerRegistry(config_path) construction should parse the YAML file
+once, while edits to the file on disk must still be picked up.
+"""
+import os
+import sys
+from pathlib import Path
+
+# Add the tools directory to the path
+repo_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(repo_root / "tools"))
+
+from requirements_automation.handler_registry import HandlerRegistry, _load_registry_yaml
+
+REGISTRY_YAML = """requirements:
+  problem_statement:
+    mode: integrate_then_questions
+    output_format: prose
+    subsections: false
+    dedupe: false
+    preserve_headers: []
+    sanitize_remove: []
+    llm_profile: requirements
+    auto_apply_patches: never
+    scope: current_section
+"""
+
+
+def test_registry_yaml_parsed_once_per_mtime(tmp_path):
+    """Repeated construction hits the cache; instances do not share config dicts."""
+    config_path = tmp_path / "handler_registry.yaml"
+    config_path.write_text(REGISTRY_YAML)
+    _load_registry_yaml.cache_clear()
+
+    first = HandlerRegistry(config_path)
+    second = HandlerRegistry(config_path)
+
+    info = _load_registry_yaml.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert first.config == second.config
+    assert first.config is not second.config
+
+
+def test_registry_cache_invalidated_on_file_change(tmp_path):
+    """Rewriting the YAML file (new mtime) forces a fresh parse."""
+    config_path = tmp_path / "handler_registry.yaml"
+    config_path.write_text(REGISTRY_YAML)
+    first = HandlerRegistry(config_path)
+    assert first.get_handler_config("requirements", "problem_statement").output_format == "prose"
+
+    config_path.write_text(REGISTRY_YAML.replace("output_format: prose", "output_format: bullets"))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = HandlerRegistry(config_path)
+    assert second.get_handler_config("requirements", "problem_statement").output_format == "bullets"
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for extracting JSON objects from LLM output.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the tools directory to the path
+repo_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(repo_root / "tools"))
+
+from requirements_automation.llm_parsing import extract_json_object
+
+
+def test_fenced_json_preferred_over_surrounding_prose():
+    """A ```json fence wins even when prose around it contains braces."""
+    text = 'Here {is} the result:\n```json\n{"a": {"b": 1}}\n```\nThanks {bye}'
+    assert extract_json_object(text) == '{"a": {"b": 1}}'
+
+
+def test_first_closing_fence_ends_the_object():
+    """The body stops at the first fence preceded by a closing brace."""
+    text = '```\n{"a": 1}\n```\nmore\n```json\n{"b": 2}\n```'
+    assert extract_json_object(text) == '{"a": 1}'
+
+
+def test_unclosed_fence_falls_back_to_brace_slice():
+    """Without a closing fence the outermost braces are used."""
+    text = '```json\n{"a": 1}\n' + "x" * 1000
+    assert extract_json_object(text) == '{"a": 1}'
+
+
+def test_no_json_raises():
+    with pytest.raises(ValueError):
+        extract_json_object("no json here")
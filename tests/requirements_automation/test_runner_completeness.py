@@ -15,6 +15,7 @@ sys.path.insert(0, str(repo_root / "tools"))
 
 from requirements_automation.runner_state import get_section_state
 from requirements_automation.models import HandlerConfig
+from requirements_automation.parsing import find_sections
 
 
 def test_section_with_answered_questions_is_incomplete():
@@ -232,6 +233,37 @@ This section has all content filled in.
     return True
 
 
+def test_precomputed_spans_match_fresh_scan():
+    """
+    Test: Passing a precomputed find_sections() result gives the same state.
+
+    WorkflowRunner.run_once parses the section index once per pass and hands
+    it to get_section_state for every target.
+    """
+    print("\nTest: Precomputed spans match a fresh scan")
+    print("=" * 70)
+
+    lines = """<!-- section:first -->
+## First
+
+<!-- PLACEHOLDER -->
+
+<!-- section:second -->
+## Second
+
+Filled in.
+""".split('\n')
+
+    spans = find_sections(lines)
+    for section_id in ("first", "second", "missing"):
+        assert get_section_state(lines, section_id, None, spans) == get_section_state(
+            lines, section_id
+        ), f"State mismatch for {section_id}"
+
+    print("  ✓ Precomputed spans give identical section state")
+    return True
+
+
 def main():
     """Run all tests."""
     print("Testing runner_core completeness check logic")
@@ -241,6 +273,7 @@ def main():
         test_section_with_answered_questions_is_incomplete,
         test_section_with_only_answered_questions,
         test_section_truly_complete,
+        test_precomputed_spans_match_fresh_scan,
     ]
     
     passed = 0
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for WorkflowRunner prior-section caching.
+
+_gather_prior_sections should scan the document once per target until
+runner.lines is next assigned, and rescan after that.
+"""
+import sys
+from pathlib import Path
+
+# Add the tools directory to the path
+repo_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(repo_root / "tools"))
+
+from requirements_automation import runner_core
+from requirements_automation.runner_core import WorkflowRunner
+
+DOC = """<!-- section:problem_statement -->
+## Problem Statement
+Filled in.
+
+<!-- section:goals_objectives -->
+## Goals
+<!-- PLACEHOLDER -->
+"""
+
+
+def _runner():
+    return WorkflowRunner(
+        lines=DOC.splitlines(),
+        llm=None,
+        doc_type="requirements",
+        workflow_order=["problem_statement", "goals_objectives"],
+    )
+
+
+def _count_gathers(monkeypatch):
+    calls = []
+    real = runner_core.gather_prior_sections
+
+    def counting(*args, **kwargs):
+        calls.append(args[2])
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(runner_core, "gather_prior_sections", counting)
+    return calls
+
+
+def test_prior_sections_reused_for_unchanged_document(monkeypatch):
+    """A second call on the same document is served from the cache."""
+    calls = _count_gathers(monkeypatch)
+    runner = _runner()
+
+    first = runner._gather_prior_sections("goals_objectives")
+    second = runner._gather_prior_sections("goals_objectives")
+
+    assert calls == ["goals_objectives"]
+    assert first == second == {"problem_statement": "Filled in."}
+    assert first is not second
+
+
+def test_prior_sections_rescanned_after_edit(monkeypatch):
+    """Reassigning runner.lines, even to the same edited list, invalidates the cache."""
+    calls = _count_gathers(monkeypatch)
+    runner = _runner()
+
+    runner._gather_prior_sections("goals_objectives")
+    lines = runner.lines
+    lines[2] = "Rewritten."
+    runner.lines = lines
+    prior = runner._gather_prior_sections("goals_objectives")
+
+    assert len(calls) == 2
+    assert prior == {"problem_statement": "Rewritten."}
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Tests for WorkflowRunner.run_until.
+
+run_until drives run_once until the requested target has been processed and
+returns that target's result, or None when the workflow stops short of it.
+"""
+import sys
+from pathlib import Path
+
+# Add the tools directory to the path
+repo_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(repo_root / "tools"))
+
+from requirements_automation.runner_core import WorkflowRunner
+
+DOC = """<!-- section:problem_statement -->
+## Problem Statement
+
+Filled in.
+"""
+
+
+def _runner(workflow_order):
+    return WorkflowRunner(
+        lines=DOC.splitlines(),
+        llm=None,
+        doc_type="requirements",
+        workflow_order=workflow_order,
+    )
+
+
+def test_run_until_returns_target_result():
+    """Completed sections are skipped and the gate's result is returned."""
+    runner = _runner(["problem_statement", "review_gate:coherence_check"])
+
+    result = runner.run_until("review_gate:coherence_check")
+
+    assert result is not None
+    assert result.target_id == "review_gate:coherence_check"
+
+
+def test_run_until_returns_none_when_target_not_reached():
+    """A workflow that completes before the target yields None."""
+    runner = _runner(["problem_statement"])
+
+    assert runner.run_until("review_gate:coherence_check") is None
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for CLI template caching.
+
+Repeated --validate-structure runs against the same template should read and
+split it once, while edits to the template on disk must still be picked up.
+"""
+import os
+import sys
+from pathlib import Path
+
+# Add the tools directory to the path
+repo_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(repo_root / "tools"))
+
+from requirements_automation.cli import _load_template_lines
+
+TEMPLATE = """<!-- meta:doc_type value="requirements" -->
+<!-- workflow:order
+problem_statement
+-->
+"""
+
+
+def test_template_read_once_per_mtime(tmp_path):
+    """Repeated loads of an unchanged template hit the cache."""
+    template_path = tmp_path / "template.md"
+    template_path.write_text(TEMPLATE)
+    _load_template_lines.cache_clear()
+
+    key = (str(template_path), template_path.stat().st_mtime_ns)
+    first = _load_template_lines(*key)
+    second = _load_template_lines(*key)
+
+    info = _load_template_lines.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert first is second
+    assert first[0] == '<!-- meta:doc_type value="requirements" -->'
+
+
+def test_template_cache_invalidated_on_file_change(tmp_path):
+    """Rewriting the template (new mtime) forces a fresh read."""
+    template_path = tmp_path / "template.md"
+    template_path.write_text(TEMPLATE)
+    first = _load_template_lines(str(template_path), template_path.stat().st_mtime_ns)
+
+    template_path.write_text(TEMPLATE + "<!-- section:problem_statement -->\n")
+    stat = template_path.stat()
+    os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = _load_template_lines(str(template_path), template_path.stat().st_mtime_ns)
+    assert len(second) == len(first) + 1
+    assert second[-1] == "<!-- section:problem_statement -->"
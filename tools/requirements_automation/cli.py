@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 import shutil
 from dataclasses import asdict
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from .cli_config import load_handler_registry
 from .cli_validators import (
@@ -18,15 +19,157 @@ from .cli_validators import (
 )
 from .document_validator import DocumentValidator
 from .git_utils import commit_and_push
+from .handler_registry import HandlerRegistry
 from .llm import LLMClient
 from .models import RunResult
-from .parsing import extract_metadata
 from .runner_v2 import WorkflowRunner
 from .structural_validator import StructuralValidator, report_structural_errors
 from .utils_io import backup_file_outside_repo, join_lines, read_text, split_lines, write_text
 from .versioning import get_current_version
 
 
+@functools.lru_cache(maxsize=8)
+def _load_template_lines(path_str: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Read and split a template file, memoized by (path, mtime).
+
+    The mtime is part of the cache key so edits to the template on disk are
+    picked up. Returned as a tuple so the cached value cannot be mutated.
+    """
+    return tuple(split_lines(read_text(Path(path_str))))
+
+
+def validate_document_structure(template_path: Path, doc_path: Path) -> int:
+    """
+    Check document structure without processing (the ``--validate-structure`` mode).
+
+    Repairs made by the structural validator are written back to doc_path.
+
+    Args:
+        template_path: Template used for cross-reference validation (optional on disk)
+        doc_path: Requirements document to check
+
+    Returns:
+        0 if the structure is valid, 1 if errors were found or repairs were made
+    """
+    lines = split_lines(read_text(doc_path))
+
+    # Load template if provided for cross-reference validation
+    template_lines = None
+    if template_path.exists():
+        # StructuralValidator copies the lines itself, so the cached tuple goes straight in
+        template_lines = _load_template_lines(str(template_path), template_path.stat().st_mtime_ns)
+
+    struct_validator = StructuralValidator(lines, template_lines)
+    errors = struct_validator.validate_all()
+
+    # Check if repairs were made
+    if struct_validator.repairs_made:
+        # Save repaired document
+        write_text(doc_path, join_lines(struct_validator.lines))
+        print(report_structural_errors(errors, struct_validator.repairs_made))
+        return 1  # Non-zero exit to indicate repair was performed
+    elif errors:
+        print(report_structural_errors(errors))
+        return 1
+    else:
+        print("✅ Document structure valid")
+        return 0
+
+
+def _check_document(
+    lines: List[str], handler_registry: HandlerRegistry
+) -> Tuple[int, str, List[str]]:
+    """
+    Run the fail-fast checks shared by --validate and workflow execution.
+
+    Args:
+        lines: Document content as list of strings
+        handler_registry: Loaded handler registry
+
+    Returns:
+        Tuple of (exit_code, doc_type, workflow_order); exit_code is 2 on failure
+    """
+    # Fail fast if structure is corrupted
+    struct_validator = StructuralValidator(lines)
+    errors = struct_validator.validate_all()
+    if errors:
+        print("ERROR: Document structure validation failed:")
+        for error in errors:
+            print(f"  - {error}")
+        return 2, "", []
+
+    doc_type, error_msg = validate_doc_type(lines)
+    if error_msg:
+        logging.error(error_msg)
+        return 2, "", []
+
+    # Validate doc_type is supported by handler registry
+    is_valid, error_msg = validate_handler_registry_support(doc_type, handler_registry)
+    if not is_valid:
+        logging.error(error_msg)
+        return 2, "", []
+
+    # Workflow order decides which phase runs next
+    workflow_order, error_msg = validate_workflow_order(lines)
+    if error_msg:
+        logging.error(error_msg)
+        return 2, "", []
+
+    return 0, doc_type, workflow_order
+
+
+def _validate_completion(lines: List[str], handler_registry: HandlerRegistry, strict: bool) -> int:
+    """Check document completion and print human- and machine-readable status."""
+    exit_code, doc_type, workflow_order = _check_document(lines, handler_registry)
+    if exit_code != 0:
+        return exit_code
+
+    doc_validator = DocumentValidator(lines, workflow_order, handler_registry, doc_type)
+    status = doc_validator.validate_completion(strict=strict)
+
+    # Print human-readable summary
+    print(status.summary)
+    print()
+
+    # Print machine-readable JSON
+    print("JSON Output:")
+    print(json.dumps(asdict(status), indent=2))
+
+    return 0 if status.complete else 1
+
+
+def validate_document(
+    doc_path: Path,
+    repo_root: Path,
+    *,
+    strict: bool = False,
+    handler_config: Path | None = None,
+) -> int:
+    """
+    Check document completion without processing (the ``--validate`` mode).
+
+    In-process equivalent of ``main(["--validate", ...])`` for an existing
+    document, without argument parsing or logging setup.
+
+    Args:
+        doc_path: Requirements document to check
+        repo_root: Repo root used to locate the default handler registry
+        strict: Include optional completion criteria
+        handler_config: Optional explicit handler registry path
+
+    Returns:
+        0 if complete, 1 if incomplete, 2 on configuration or structure errors
+    """
+    handler_registry, exit_code = load_handler_registry(handler_config, repo_root.resolve())
+    if exit_code != 0:
+        return exit_code
+    assert handler_registry is not None
+
+    lines = split_lines(read_text(doc_path))
+    return _validate_completion(lines, handler_registry, strict)
+
+
 def main(argv: List[str] | None = None) -> int:
     """Run the requirements automation workflow for a single phase pass."""
     parser = argparse.ArgumentParser(description="Requirements automation (phased).")
@@ -102,73 +245,20 @@ def main(argv: List[str] | None = None) -> int:
         shutil.copy2(template_path, doc_path)
         doc_created = True
 
-    # Load document into memory and construct the LLM client.
-    lines = split_lines(read_text(doc_path))
-
     # Handle --validate-structure flag: check structure without processing
     if args.validate_structure:
-        # Load template if provided for cross-reference validation
-        template_lines = None
-        if template_path.exists():
-            template_lines = split_lines(read_text(template_path))
-
-        struct_validator = StructuralValidator(lines, template_lines)
-        errors = struct_validator.validate_all()
-
-        # Check if repairs were made
-        if struct_validator.repairs_made:
-            # Save repaired document
-            write_text(doc_path, join_lines(struct_validator.lines))
-            print(report_structural_errors(errors, struct_validator.repairs_made))
-            return 1  # Non-zero exit to indicate repair was performed
-        elif errors:
-            print(report_structural_errors(errors))
-            return 1
-        else:
-            print("✅ Document structure valid")
-            return 0
-
-    # Fail fast if structure is corrupted
-    struct_validator = StructuralValidator(lines)
-    errors = struct_validator.validate_all()
-    if errors:
-        print("ERROR: Document structure validation failed:")
-        for error in errors:
-            print(f"  - {error}")
-        return 2
-
-    metadata = extract_metadata(lines)
-    doc_type, error_msg = validate_doc_type(lines)
-    if error_msg:
-        logging.error(error_msg)
-        return 2
-
-    # Validate doc_type is supported by handler registry
-    is_valid, error_msg = validate_handler_registry_support(doc_type, handler_registry)
-    if not is_valid:
-        logging.error(error_msg)
-        return 2
+        return validate_document_structure(template_path, doc_path)
 
-    # Decide which phase is next and execute it.
-    workflow_order, error_msg = validate_workflow_order(lines)
-    if error_msg:
-        logging.error(error_msg)
-        return 2
+    # Load document into memory and construct the LLM client.
+    lines = split_lines(read_text(doc_path))
 
     # Handle --validate flag: check completion without processing
     if args.validate:
-        doc_validator = DocumentValidator(lines, workflow_order, handler_registry, doc_type)
-        status = doc_validator.validate_completion(strict=args.strict)
-
-        # Print human-readable summary
-        print(status.summary)
-        print()
-
-        # Print machine-readable JSON
-        print("JSON Output:")
-        print(json.dumps(asdict(status), indent=2))
+        return _validate_completion(lines, handler_registry, args.strict)
 
-        return 0 if status.complete else 1
+    exit_code, doc_type, workflow_order = _check_document(lines, handler_registry)
+    if exit_code != 0:
+        return exit_code
 
     # Create LLM client only if we're not in validate mode
     llm = LLMClient()
@@ -19,7 +19,7 @@ from .config import (
     is_special_workflow_target,
 )
 from .handler_registry import HandlerRegistry
-from .models import CompletionCheck, CompletionStatus, HandlerConfig
+from .models import CompletionCheck, CompletionStatus, HandlerConfig, OpenQuestion, SectionSpan
 from .open_questions import open_questions_parse
 from .parsing import (
     extract_review_gate_results,
@@ -54,6 +54,26 @@ class DocumentValidator:
         self.workflow_order = workflow_order
         self.registry = handler_registry
         self.doc_type = doc_type
+        self._spans: List[SectionSpan] | None = None
+        self._open_questions: List[OpenQuestion] | None = None
+        self._open_questions_parsed = False
+
+    def _section_spans(self) -> List[SectionSpan]:
+        """Parse section spans on first use; the validator never edits lines."""
+        if self._spans is None:
+            self._spans = find_sections(self.lines)
+        return self._spans
+
+    def _global_open_questions(self) -> List[OpenQuestion] | None:
+        """Parse the global open_questions table once; None if it is missing or malformed."""
+        if not self._open_questions_parsed:
+            try:
+                self._open_questions, _, _ = open_questions_parse(self.lines)
+            except Exception as e:
+                logging.debug("Global open_questions table not found (expected): %s", e)
+                self._open_questions = None
+            self._open_questions_parsed = True
+        return self._open_questions
 
     def validate_completion(self, strict: bool = False) -> CompletionStatus:
         """
@@ -102,7 +122,7 @@ class DocumentValidator:
         required_sections = self._get_required_sections()
         sections_with_placeholders = []
 
-        spans = find_sections(self.lines)
+        spans = self._section_spans()
         for section_id in required_sections:
             span = get_section_span(spans, section_id)
             if span and has_placeholder(span, self.lines):
@@ -128,12 +148,10 @@ class DocumentValidator:
         Note: This check is for the deprecated global open_questions table.
         Per-section question tables are checked separately by section handlers.
         """
-        try:
-            open_questions, _, _ = open_questions_parse(self.lines)
-        except Exception as e:
+        open_questions = self._global_open_questions()
+        if open_questions is None:
             # If the global open_questions table doesn't exist, that's OK now
             # (it's been retired in favor of per-section tables)
-            logging.debug("Global open_questions table not found (expected): %s", e)
             return CompletionCheck(
                 criterion="no_open_questions",
                 passed=True,
@@ -270,7 +288,7 @@ class DocumentValidator:
 
     def _find_missing_workflow_sections(self) -> List[str]:
         """Find workflow targets that don't exist in the document."""
-        spans = find_sections(self.lines)
+        spans = self._section_spans()
         existing_sections = {sp.section_id for sp in spans}
 
         missing = []
@@ -296,7 +314,7 @@ class DocumentValidator:
 
     def _section_complete(self, section_id: str) -> bool:
         """Check if a section is complete (no placeholder, no open questions)."""
-        spans = find_sections(self.lines)
+        spans = self._section_spans()
         span = get_section_span(spans, section_id)
 
         if not span:
@@ -307,12 +325,9 @@ class DocumentValidator:
             return False
 
         # Check for open questions targeting this section
-        try:
-            open_qs, _, _ = open_questions_parse(self.lines)
-        except Exception:
-            # If global open_questions table doesn't exist, that's OK
-            # (it's been retired in favor of per-section tables)
-            open_qs = []
+        # If global open_questions table doesn't exist, that's OK
+        # (it's been retired in favor of per-section tables)
+        open_qs = self._global_open_questions() or []
 
         # Import here to avoid circular dependency
         from .config import TARGET_CANONICAL_MAP
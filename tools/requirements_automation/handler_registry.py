@@ -8,6 +8,8 @@ flexible, configuration-driven section processing.
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -16,6 +18,9 @@ import yaml
 
 from .models import HandlerConfig
 
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only ship the pure-Python one
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class HandlerRegistryError(Exception):
     """Base exception for handler registry errors."""
@@ -23,6 +28,23 @@ class HandlerRegistryError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=8)
+def _load_registry_yaml(path_str: str, mtime_ns: int) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Parse a handler registry YAML file, memoized by (path, mtime).
+
+    The mtime is part of the cache key so that edits to the file on disk
+    invalidate the cached parse. Callers must not mutate the returned dict.
+    """
+    with open(path_str, "r") as f:
+        content = yaml.load(f, Loader=_YamlSafeLoader)
+
+    if not isinstance(content, dict):
+        raise HandlerRegistryError(f"Handler registry YAML must be a dictionary at root level")
+
+    return content
+
+
 class HandlerRegistry:
     """
     Registry that maps (doc_type, section_id) -> handler configuration.
@@ -130,14 +152,10 @@ class HandlerRegistry:
         self._validate_schema()
 
     def _load_yaml(self, path: Path) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        """Load and parse YAML configuration file."""
-        with open(path, "r") as f:
-            content = yaml.safe_load(f)
-
-        if not isinstance(content, dict):
-            raise HandlerRegistryError(f"Handler registry YAML must be a dictionary at root level")
-
-        return content
+        """Load and parse YAML configuration file (cached across instances)."""
+        content = _load_registry_yaml(str(path.resolve()), path.stat().st_mtime_ns)
+        # Each registry gets its own copy so the shared cache entry stays pristine
+        return copy.deepcopy(content)
 
     def _validate_schema(self) -> None:
         """
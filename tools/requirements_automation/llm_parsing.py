@@ -1,6 +1,35 @@
 """JSON parsing utilities for LLM responses."""
 
-import re
+from typing import Optional
+
+FENCE = "```"
+
+
+def _find_fenced_json(t: str) -> Optional[str]:
+    """Return the first fenced ```json {...}``` body in t, or None.
+
+    Walks fence positions with str.find instead of the former lazy DOTALL
+    regex, which rescanned to the end of the text for every unclosed fence.
+    """
+    i = t.find(FENCE)
+    while i != -1:
+        j = i + len(FENCE)
+        if t[j : j + 4].lower() == "json":
+            j += 4
+        while j < len(t) and t[j].isspace():
+            j += 1
+        if j < len(t) and t[j] == "{":
+            # Earliest later fence preceded (modulo whitespace) by a closing brace
+            f = t.find(FENCE, j + 1)
+            while f != -1:
+                k = f - 1
+                while k > j and t[k].isspace():
+                    k -= 1
+                if k > j and t[k] == "}":
+                    return t[j : k + 1]
+                f = t.find(FENCE, f + 1)
+        i = t.find(FENCE, i + 1)
+    return None
 
 
 def extract_json_object(text: str) -> str:
@@ -17,9 +46,9 @@ def extract_json_object(text: str) -> str:
     """
     t = (text or "").strip()
     # Prefer JSON embedded in a markdown code fence, if present.
-    m = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", t, re.DOTALL | re.IGNORECASE)
-    if m:
-        return m.group(1).strip()
+    fenced = _find_fenced_json(t)
+    if fenced is not None:
+        return fenced.strip()
     # Fall back to raw braces if the entire response is JSON.
     if t.startswith("{") and t.endswith("}"):
         return t
@@ -65,14 +65,14 @@ def _build_subsection_guidance_for_questions(subsection_structure: Optional[List
     if not subsection_structure:
         return ""
     
-    guidance = "\n\n**Subsection Structure:**\nThis section has the following subsections:\n"
+    parts = ["\n\n**Subsection Structure:**\nThis section has the following subsections:\n"]
     for sub in subsection_structure:
         sub_id = sub.get("id", "")
         sub_type = sub.get("type", "prose")
-        guidance += f"- `{sub_id}`: {sub_type}\n"
-    guidance += "\nWhen generating questions, target them to the appropriate subsection using section_target.\n"
+        parts.append(f"- `{sub_id}`: {sub_type}\n")
+    parts.append("\nWhen generating questions, target them to the appropriate subsection using section_target.\n")
     
-    return guidance
+    return "".join(parts)
 
 
 def _build_subsection_guidance(subsection_structure: Optional[List[dict]]) -> str:
@@ -87,24 +87,26 @@ def _build_subsection_guidance(subsection_structure: Optional[List[dict]]) -> st
     if not subsection_structure:
         return ""
     
-    guidance = "\n\n**Subsection Structure:**\n"
-    guidance += "This section has the following subsections. Output content using subsection delimiters:\n"
+    parts = [
+        "\n\n**Subsection Structure:**\n",
+        "This section has the following subsections. Output content using subsection delimiters:\n",
+    ]
     for sub in subsection_structure:
         sub_id = sub.get("id", "")
         sub_type = sub.get("type", "prose")
         # Convert subsection_id to readable header
         readable_header = sub_id.replace("_", " ").title()
-        guidance += f"\n### {readable_header}\n"
+        parts.append(f"\n### {readable_header}\n")
         if sub_type == "table":
-            guidance += "Output: Markdown table rows only (no header, just data rows with pipe delimiters).\n"
+            parts.append("Output: Markdown table rows only (no header, just data rows with pipe delimiters).\n")
         elif sub_type == "bullets":
-            guidance += "Output: Bullet list items (dash-prefixed).\n"
+            parts.append("Output: Bullet list items (dash-prefixed).\n")
         elif sub_type == "numbered":
-            guidance += "Output: Numbered list items (1., 2., 3., etc.).\n"
+            parts.append("Output: Numbered list items (1., 2., 3., etc.).\n")
         else:
-            guidance += "Output: Prose or list as appropriate.\n"
+            parts.append("Output: Prose or list as appropriate.\n")
     
-    return guidance
+    return "".join(parts)
 
 
 def build_open_questions_prompt(
@@ -7,6 +7,9 @@ from .config import OPEN_Q_COLUMNS, PLACEHOLDER_TOKEN
 from .models import OpenQuestion
 from .parsing import find_table_block
 
+QUESTION_ID_RE = re.compile(r"Q-(\d+)$")
+WHITESPACE_RE = re.compile(r"\s+")
+
 
 def parse_markdown_table(table_lines: List[str]) -> List[List[str]]:
     """Convert markdown table lines into a list of cell arrays."""
@@ -54,7 +57,7 @@ def open_questions_parse(lines: List[str], table_id: str = "open_questions") ->
 
 def _norm(s: str) -> str:
     """Normalize strings for duplicate detection (case/space-insensitive)."""
-    return re.sub(r"\s+", " ", s.strip().lower())
+    return WHITESPACE_RE.sub(" ", s.strip().lower())
 
 
 def _is_placeholder_row(cells: List[str]) -> bool:
@@ -67,14 +70,24 @@ def _build_row(qid: str, question: str, date: str, answer: str, target: str, sta
     return f"| {qid} | {question} | {date} | {answer} | {target} | {status} |"
 
 
-def open_questions_next_id(existing: List[OpenQuestion]) -> str:
-    """Generate the next sequential Q-XXX identifier."""
+def _max_question_number(existing: List[OpenQuestion]) -> int:
+    """Return the highest N among existing Q-NNN identifiers (0 if none)."""
     max_n = 0
     for q in existing:
-        m = re.match(r"Q-(\d+)$", q.question_id.strip())
+        m = QUESTION_ID_RE.match(q.question_id.strip())
         if m:
             max_n = max(max_n, int(m.group(1)))
-    return f"Q-{max_n + 1:03d}"
+    return max_n
+
+
+def _format_question_id(n: int) -> str:
+    """Render a sequential question number as a Q-XXX identifier."""
+    return f"Q-{n:03d}"
+
+
+def open_questions_next_id(existing: List[OpenQuestion]) -> str:
+    """Generate the next sequential Q-XXX identifier."""
+    return _format_question_id(_max_question_number(existing) + 1)
 
 
 def open_questions_insert(
@@ -92,14 +105,16 @@ def open_questions_insert(
     """
     existing, (start, end), _ = open_questions_parse(lines, table_id)
     existing_keys = {(_norm(q.question), _norm(q.section_target)) for q in existing}
+    # Scan existing IDs once; new IDs are allocated sequentially from there.
+    next_n = _max_question_number(existing) + 1
     to_insert: List[str] = []
     inserted = 0
     for q_text, target, date in new_questions:
         key = (_norm(q_text), _norm(target))
         if key in existing_keys:
             continue
-        qid = open_questions_next_id(existing)
-        existing.append(OpenQuestion(qid, q_text, date, "", target, "Open"))
+        qid = _format_question_id(next_n)
+        next_n += 1
         to_insert.append(_build_row(qid, q_text, date, "", target, "Open"))
         existing_keys.add(key)
         inserted += 1
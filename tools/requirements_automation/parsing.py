@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .config import (
     META_MARKER_RE,
@@ -104,6 +104,10 @@ def find_sections(lines: List[str]) -> List[SectionSpan]:
     """Locate section markers and return their line spans."""
     starts: List[Tuple[str, int]] = []
     for i, ln in enumerate(lines):
+        # Every marker regex starts with a literal "<!--"; lines without one are
+        # rejected by a substring check before the regex engine runs
+        if "<!--" not in ln:
+            continue
         m = SECTION_MARKER_RE.search(ln)
         if m:
             starts.append((m.group("id"), i))
@@ -196,6 +200,8 @@ def find_table_block(lines: List[str], table_id: str) -> Optional[Tuple[int, int
     """Find a markdown table block that follows a <!-- table:... --> marker."""
     marker_line = None
     for i, ln in enumerate(lines):
+        if "<!--" not in ln:
+            continue
         m = TABLE_MARKER_RE.search(ln)
         if m and m.group("id") == table_id:
             marker_line = i
@@ -292,20 +298,10 @@ def section_exists(section_id: str, lines: List[str]) -> bool:
 
 def contains_markers(text: str) -> bool:
     """Check if text contains structure markers or HTML comments."""
-    markers = [
-        SECTION_MARKER_RE,
-        SECTION_LOCK_RE,
-        TABLE_MARKER_RE,
-        SUBSECTION_MARKER_RE,
-        META_MARKER_RE,
-    ]
-    for marker_re in markers:
-        if marker_re.search(text):
-            return True
-    # Also check for any HTML comments (which would be structural markers)
-    if "<!--" in text and "-->" in text:
-        return True
-    return False
+    # Every structure marker (section, section_lock, table, subsection, meta) is an
+    # HTML comment, so one pair of substring checks covers them all without
+    # running each marker regex over the text.
+    return "<!--" in text and "-->" in text
 
 
 def apply_patch(section_id: str, suggestion: str, lines: List[str]) -> List[str]:
@@ -344,40 +340,21 @@ def apply_patch(section_id: str, suggestion: str, lines: List[str]) -> List[str]
     if contains_markers(suggestion):
         raise ValueError(f"Patch suggestion contains forbidden structure markers")
 
-    # Build new content preserving markers and headers
-    new_lines = []
-    in_section = False
-    body_started = False
-
-    for i, line in enumerate(lines):
-        if i == span.start_line:
-            # Add section marker
-            new_lines.append(line)
-            in_section = True
-            continue
-
-        if in_section and i < span.end_line:
-            # Skip old body content, but preserve lock markers and headers
-            if SECTION_LOCK_RE.search(line):
-                new_lines.append(line)
-            elif line.lstrip().startswith("##"):
-                new_lines.append(line)
-            elif not body_started:
-                # Insert new content after headers/markers
-                for suggestion_line in suggestion.split("\n"):
-                    new_lines.append(suggestion_line)
-                body_started = True
-        elif i == span.end_line:
-            # Reached end of section
-            if not body_started:
-                # No headers found, insert content now
-                for suggestion_line in suggestion.split("\n"):
-                    new_lines.append(suggestion_line)
-            in_section = False
-            body_started = False
-            new_lines.append(line)
-        else:
-            new_lines.append(line)
+    # Rebuild only the section body; lines outside the span are spliced in as slices
+    body: List[str] = []
+    inserted = False
+    for line in lines[span.start_line + 1 : span.end_line]:
+        # Keep lock markers and headers, replace the first body line with the suggestion
+        if SECTION_LOCK_RE.search(line) or line.lstrip().startswith("##"):
+            body.append(line)
+        elif not inserted:
+            body.extend(suggestion.split("\n"))
+            inserted = True
+    if not inserted:
+        # No body lines found, append content after the headers/markers
+        body.extend(suggestion.split("\n"))
+
+    new_lines = lines[: span.start_line + 1] + body + lines[span.end_line :]
 
     # Validate structure after patch
     validator_after = StructuralValidator(new_lines)
@@ -399,6 +376,8 @@ def extract_review_gate_results(lines: List[str]) -> Dict[str, Tuple[str, int, i
     results: Dict[str, Tuple[str, int, int]] = {}
 
     for line in lines:
+        if "<!--" not in line:
+            continue
         m = REVIEW_GATE_RESULT_RE.search(line)
         if m:
             gate_id = m.group("gate_id")
@@ -420,6 +399,8 @@ def find_duplicate_section_markers(lines: List[str]) -> List[str]:
     section_counts: Dict[str, int] = {}
 
     for line in lines:
+        if "<!--" not in line:
+            continue
         m = SECTION_MARKER_RE.search(line)
         if m:
             section_id = m.group("id")
@@ -633,6 +614,39 @@ def check_risks_table_for_non_low_risks(lines: List[str]) -> Tuple[bool, List[st
     return len(non_low_risks) > 0, non_low_risks
 
 
+def _apply_section_lock(lines: List[str], span: SectionSpan, lock: bool) -> None:
+    """
+    Set the lock marker for one section span, editing lines in place.
+
+    Replaces an existing marker, or inserts one after the last content line of
+    the section. Only lines at or after the edit point within the span shift.
+    """
+    section_id = span.section_id
+    lock_value = "true" if lock else "false"
+    new_marker = f"<!-- section_lock:{section_id} lock={lock_value} -->"
+
+    # Look for existing lock marker in the section
+    for i in range(span.start_line, span.end_line):
+        m = SECTION_LOCK_RE.search(lines[i])
+        if m and m.group("id") == section_id:
+            # Replace existing lock marker
+            lines[i] = new_marker
+            return
+
+    # Insert new lock marker at the end of the section (before the separator)
+    # Find the last line before the next section or end
+    insert_idx = span.end_line - 1
+
+    # Move back to skip trailing empty lines and "---" separators
+    while insert_idx > span.start_line and (
+        lines[insert_idx].strip() == "" or lines[insert_idx].strip() == "---"
+    ):
+        insert_idx -= 1
+
+    # Insert after the last content line
+    lines.insert(insert_idx + 1, new_marker)
+
+
 def set_section_lock(lines: List[str], section_id: str, lock: bool) -> List[str]:
     """
     Set the section lock marker for a section.
@@ -652,36 +666,32 @@ def set_section_lock(lines: List[str], section_id: str, lock: bool) -> List[str]
         # Section not found, return lines unchanged
         return lines
     
-    lock_value = "true" if lock else "false"
-    new_marker = f"<!-- section_lock:{section_id} lock={lock_value} -->"
-    
-    # Look for existing lock marker in the section
-    lock_line_idx = None
-    for i in range(span.start_line, span.end_line):
-        m = SECTION_LOCK_RE.search(lines[i])
-        if m and m.group("id") == section_id:
-            lock_line_idx = i
-            break
-    
     new_lines = lines.copy()
-    
-    if lock_line_idx is not None:
-        # Replace existing lock marker
-        new_lines[lock_line_idx] = new_marker
-    else:
-        # Insert new lock marker at the end of the section (before the separator)
-        # Find the last line before the next section or end
-        insert_idx = span.end_line - 1
-        
-        # Move back to skip trailing empty lines and "---" separators
-        while insert_idx > span.start_line and (
-            new_lines[insert_idx].strip() == "" or new_lines[insert_idx].strip() == "---"
-        ):
-            insert_idx -= 1
-        
-        # Insert after the last content line
-        new_lines.insert(insert_idx + 1, new_marker)
-    
+    _apply_section_lock(new_lines, span, lock)
+    return new_lines
+
+
+def set_section_locks(lines: List[str], section_ids: Iterable[str], lock: bool) -> List[str]:
+    """
+    Set the section lock marker for several sections with a single marker scan.
+
+    Sections are edited bottom-up so an inserted marker never shifts the span
+    of a section that is still to be processed.
+
+    Args:
+        lines: Document content as list of strings
+        section_ids: Section IDs to lock/unlock (unknown IDs are ignored)
+        lock: True to lock, False to unlock
+
+    Returns:
+        Updated document lines
+    """
+    spans = find_sections(lines)
+    targets = [sp for sp in (get_section_span(spans, sid) for sid in set(section_ids)) if sp]
+
+    new_lines = lines.copy()
+    for span in sorted(targets, key=lambda sp: sp.start_line, reverse=True):
+        _apply_section_lock(new_lines, span, lock)
     return new_lines
 
 
@@ -24,7 +24,6 @@ from .parsing import (
     find_sections,
     get_section_span,
     section_body,
-    section_exists,
 )
 from .section_questions import insert_section_questions_batch
 
@@ -224,10 +223,16 @@ class ReviewGateHandler:
         Returns:
             ReviewResult with validated patches
         """
+        if not result.patches:
+            # Nothing to validate; skip the section scan
+            return result
+
         validated_patches = []
+        # Scan section markers once; each patch target is then a set lookup
+        existing_sections = {sp.section_id for sp in find_sections(self.lines)}
         for patch in result.patches:
             # Check section exists
-            if not section_exists(patch.section, self.lines):
+            if patch.section not in existing_sections:
                 logging.warning(f"Patch targets unknown section: {patch.section}")
                 validated_patches.append(replace(patch, validated=False))
                 continue
@@ -270,6 +275,10 @@ class ReviewGateHandler:
         if auto_apply == "never":
             return self.lines, False
 
+        if auto_apply in ("always", "if_validation_passes") and not result.patches:
+            # No patches from the review: nothing to apply
+            return self.lines, False
+
         if auto_apply == "if_validation_passes":
             if not all(p.validated for p in result.patches):
                 logging.info("Patches not auto-applied: validation failed")
@@ -509,11 +518,11 @@ class ReviewGateHandler:
             scope_sections: List of section IDs that were in scope (these get locked)
         """
         from .config import AUTOMATION_ACTOR
-        from .parsing import set_section_lock, update_approval_record_table
+        from .parsing import set_section_locks, update_approval_record_table
         
-        # Lock all prior sections
+        # Lock all prior sections (one marker scan for the whole batch)
+        self.lines = set_section_locks(self.lines, scope_sections, lock=True)
         for section_id in scope_sections:
-            self.lines = set_section_lock(self.lines, section_id, lock=True)
             logging.info(f"Locked section: {section_id}")
         
         # Update approval record table
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from .config import REVIEW_GATE_RESULT_RE, is_special_workflow_target
 from .handler_registry import HandlerRegistry
 from .models import WorkflowResult
+from .parsing import find_sections
 from .runner_handlers import (
     execute_phase_based_handler,
     execute_review_gate,
@@ -47,12 +48,50 @@ class WorkflowRunner:
             workflow_order: List of target IDs to process in order
             handler_registry: Handler registry instance
         """
+        # Prior-section context per target, dropped whenever self.lines is assigned
+        self._prior_sections_cache: Dict[str, Dict[str, str]] = {}
         self.lines = lines
         self.llm = llm
         self.doc_type = doc_type
         self.workflow_order = workflow_order
         self.handler_registry = handler_registry
 
+    @property
+    def lines(self) -> List[str]:
+        """Document content as list of strings."""
+        return self._lines
+
+    @lines.setter
+    def lines(self, value: List[str]) -> None:
+        # Every document update in the runner reassigns self.lines (handlers that
+        # edit in place still return the list), so this is where the cache goes stale
+        self._lines = value
+        self._prior_sections_cache = {}
+
+    def _gather_prior_sections(self, target_id: str) -> Dict[str, str]:
+        """
+        Gather completed prior section content for a target, cached per document state.
+
+        Repeated calls for the same target reuse the earlier result instead of
+        re-scanning every prior section, until self.lines is next assigned.
+        Callers that edit the list in place must reassign it afterwards.
+
+        Args:
+            target_id: Section ID to gather prior sections for
+
+        Returns:
+            Dict mapping section_id → body content for all completed prior sections
+        """
+        prior_sections = self._prior_sections_cache.get(target_id)
+        if prior_sections is None:
+            prior_sections = gather_prior_sections(
+                self.lines, self.workflow_order, target_id, self.handler_registry, self.doc_type
+            )
+            self._prior_sections_cache[target_id] = prior_sections
+
+        # Hand out a copy so callers can't alter the cached entry
+        return dict(prior_sections)
+
     def _check_and_update_version(self, target_id: str, result: WorkflowResult) -> None:
         """Check if version should be updated after processing a target.
 
@@ -76,12 +115,11 @@ class WorkflowRunner:
             new_version = get_version_for_section(target_id)
 
             # Create change description based on target type
-            if target_id.startswith("review_gate:"):
-                changes = (
-                    f"{target_id.replace('review_gate:', '').replace('_', ' ').title()} completed"
-                )
-            else:
-                changes = f"{target_id.replace('_', ' ').title()} completed"
+            # Strip the gate prefix by slicing so only one replace pass runs over the name
+            name = target_id
+            if name.startswith("review_gate:"):
+                name = name[len("review_gate:") :]
+            changes = f"{name.replace('_', ' ').title()} completed"
 
             # Update document version
             self.lines = update_document_version(self.lines, new_version, changes)
@@ -136,9 +174,7 @@ class WorkflowRunner:
         ):
             # Gather prior completed sections for context based on scope config
             if handler_config.scope == "all_prior_sections":
-                prior_sections = gather_prior_sections(
-                    self.lines, self.workflow_order, target_id, self.handler_registry, self.doc_type
-                )
+                prior_sections = self._gather_prior_sections(target_id)
             else:
                 # For current_section scope or any other scope, don't pass prior context
                 prior_sections = {}
@@ -172,6 +208,10 @@ class WorkflowRunner:
         Returns:
             WorkflowResult with execution details
         """
+        # Lines only change once a handler runs (and we return right after), so
+        # the section index is parsed once per pass instead of once per target
+        spans = find_sections(self.lines)
+
         for target_id in self.workflow_order:
             # Handle special workflow targets (e.g., review gates)
             if is_special_workflow_target(target_id):
@@ -182,23 +222,16 @@ class WorkflowRunner:
                             self.doc_type, target_id
                         )
                         if handler_config.mode == "review_gate":
-                            # Check if review gate already passed
-                            gate_already_passed = False
-                            for line in self.lines:
-                                m = REVIEW_GATE_RESULT_RE.search(line)
-                                if (
-                                    m
-                                    and m.group("gate_id") == target_id
-                                    and m.group("status") == "passed"
-                                ):
-                                    gate_already_passed = True
-                                    logging.info(
-                                        "Review gate '%s' already passed, skipping", target_id
-                                    )
-                                    break
+                            # Check if review gate already passed (stops at the first match)
+                            gate_already_passed = any(
+                                m.group("gate_id") == target_id and m.group("status") == "passed"
+                                for m in map(REVIEW_GATE_RESULT_RE.search, self.lines)
+                                if m
+                            )
 
                             if gate_already_passed:
                                 # Skip this gate and continue to next workflow target
+                                logging.info("Review gate '%s' already passed, skipping", target_id)
                                 continue
 
                             # Execute review gate
@@ -250,7 +283,7 @@ class WorkflowRunner:
                     logging.debug("Could not get handler config for '%s': %s", target_id, e)
 
             # Get section state
-            state = get_section_state(self.lines, target_id, handler_config)
+            state = get_section_state(self.lines, target_id, handler_config, spans)
 
             # Skip if section doesn't exist (shouldn't happen after validation)
             if not state.exists:
@@ -322,3 +355,37 @@ class WorkflowRunner:
                 break
 
         return results
+
+    def run_until(
+        self, target_id: str, dry_run: bool = False, max_steps: int = 20
+    ) -> Optional[WorkflowResult]:
+        """
+        Execute workflow targets until the given target has been processed.
+
+        Args:
+            target_id: Workflow target to stop at (e.g. "review_gate:coherence_check")
+            dry_run: If True, don't modify document or persist changes
+            max_steps: Maximum number of iterations (default: 20)
+
+        Returns:
+            WorkflowResult for target_id, or None if the workflow completed, stopped
+            making progress, or hit max_steps before reaching it
+        """
+        for step in range(max_steps):
+            result = self.run_once(dry_run)
+
+            if result.target_id == target_id:
+                return result
+
+            # Stop if complete or no changes (the next pass would repeat this one)
+            if result.action_taken == "complete" or not result.changed:
+                logging.info(
+                    "Stopped after %d steps before reaching '%s': %s",
+                    step + 1,
+                    target_id,
+                    result.action_taken,
+                )
+                return None
+
+        logging.info("Reached max steps (%d) before '%s'", max_steps, target_id)
+        return None
@@ -461,11 +461,15 @@ def generate_questions_for_section(
     # Determine if using section-specific questions
     use_section_qs = _use_section_questions(handler_config)
 
+    # Parsed section questions table, reused for insertion below (lines are unchanged until then)
+    parsed_qs = None
+
     # Check for existing unanswered questions
     if use_section_qs:
         # Check section-specific table
         try:
-            qs, _ = parse_section_questions(lines, target_id)
+            parsed_qs = parse_section_questions(lines, target_id)
+            qs, _ = parsed_qs
             open_unanswered = [
                 q
                 for q in qs
@@ -520,7 +524,9 @@ def generate_questions_for_section(
     if new_qs and not dry_run:
         try:
             # Insert into section-specific table
-            lines, inserted = insert_section_questions_batch(lines, target_id, new_qs)
+            lines, inserted = insert_section_questions_batch(
+                lines, target_id, new_qs, parsed=parsed_qs
+            )
 
             if inserted:
                 summaries.append(f"Generated {inserted} open questions for {target_id}")
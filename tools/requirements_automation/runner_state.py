@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
-from .config import PLACEHOLDER_TOKEN, TARGET_CANONICAL_MAP
+from .config import PLACEHOLDER_TOKEN, TABLE_MARKER_RE, TARGET_CANONICAL_MAP
 from .models import SectionSpan, SectionState, SubsectionSpan
 from .open_questions import open_questions_parse
 from .parsing import (
@@ -14,10 +14,10 @@ from .parsing import (
     get_section_span,
     has_placeholder,
     section_body,
-    section_is_blank,
     section_is_locked,
 )
 from .section_questions import (
+    get_section_questions_table_name,
     has_open_section_questions,
     parse_section_questions,
     section_has_answered_questions,
@@ -58,8 +58,51 @@ def _get_replacement_end_boundary(
     return section_span.end_line
 
 
+def _uses_section_questions(handler_config: Optional[Any]) -> bool:
+    """
+    Return True if a section's state should consider its own questions table.
+
+    Sections without a handler config fall back to the {section_id}_questions
+    naming convention; configured sections only do so when they declare a
+    questions_table.
+    """
+    return handler_config is None or getattr(handler_config, "questions_table", None) is not None
+
+
+def _section_question_flags(lines: List[str], section_id: str) -> Tuple[bool, bool]:
+    """
+    Scan a section's questions table for unanswered and answered-but-open rows.
+
+    Args:
+        lines: Document content as list of strings
+        section_id: Section whose {section_id}_questions table to read
+
+    Returns:
+        Tuple of (has_open_questions, has_answered_questions); both False when
+        the table is missing or malformed
+    """
+    try:
+        qs, _ = parse_section_questions(lines, section_id)
+    except Exception as e:
+        logging.debug("Failed to parse section questions for '%s': %s", section_id, e)
+        return False, False
+
+    has_open_questions = any(
+        q.status.strip() in ("Open", "Deferred") and q.answer.strip() in ("", "-", "Pending")
+        for q in qs
+    )
+    has_answered_questions = any(
+        q.answer.strip() not in ("", "-", "Pending") and q.status.strip() in ("Open", "Deferred")
+        for q in qs
+    )
+    return has_open_questions, has_answered_questions
+
+
 def get_section_state(
-    lines: List[str], target_id: str, handler_config: Optional[Any] = None
+    lines: List[str],
+    target_id: str,
+    handler_config: Optional[Any] = None,
+    spans: Optional[List[SectionSpan]] = None,
 ) -> SectionState:
     """
     Extract section state for decision-making.
@@ -68,11 +111,13 @@ def get_section_state(
         lines: Document content as list of strings
         target_id: Section ID to analyze
         handler_config: Optional handler configuration (to determine question table)
+        spans: Optional precomputed find_sections(lines) result; must match lines
 
     Returns:
         SectionState object with section information
     """
-    spans = find_sections(lines)
+    if spans is None:
+        spans = find_sections(lines)
     span = get_section_span(spans, target_id)
 
     if not span:
@@ -87,66 +132,17 @@ def get_section_state(
         )
 
     locked = section_is_locked(lines, span)
-    is_blank = section_is_blank(lines, span)
 
-    # Check for placeholder token in preamble only (ignoring subsections)
+    # Check for placeholder token in preamble only (ignoring subsections); a
+    # section is blank by exactly the same test, so the preamble is scanned once
     section_has_placeholder = has_placeholder(span, lines)
+    is_blank = section_has_placeholder
 
-    # Determine if using section-specific questions
-    use_section_qs = (
-        handler_config is not None
-        and hasattr(handler_config, "questions_table")
-        and handler_config.questions_table is not None
-    )
-
-    # Initialize question state
+    # Check for open questions in the section's own table when it uses one
     has_open_questions = False
     has_answered_questions = False
-
-    # Check for open questions
-    if use_section_qs:
-        # Use section-specific table
-        try:
-            qs, _ = parse_section_questions(lines, target_id)
-            has_open_questions = any(
-                q.status.strip() in ("Open", "Deferred")
-                and q.answer.strip() in ("", "-", "Pending")
-                for q in qs
-            )
-            has_answered_questions = any(
-                q.answer.strip() not in ("", "-", "Pending")
-                and q.status.strip() in ("Open", "Deferred")
-                for q in qs
-            )
-        except Exception as e:
-            logging.debug(
-                "Failed to parse section questions for '%s': %s",
-                target_id,
-                e,
-            )
-            # When handler_config is None or section table parsing fails,
-            # default to no questions rather than falling back to global table
-            has_open_questions = False
-            has_answered_questions = False
-    elif handler_config is None:
-        # When handler_config is None, try to use section-specific questions
-        # using the naming convention {section_id}_questions
-        try:
-            qs, _ = parse_section_questions(lines, target_id)
-            has_open_questions = any(
-                q.status.strip() in ("Open", "Deferred")
-                and q.answer.strip() in ("", "-", "Pending")
-                for q in qs
-            )
-            has_answered_questions = any(
-                q.answer.strip() not in ("", "-", "Pending")
-                and q.status.strip() in ("Open", "Deferred")
-                for q in qs
-            )
-        except Exception:
-            # If section table doesn't exist, default to no questions
-            has_open_questions = False
-            has_answered_questions = False
+    if _uses_section_questions(handler_config):
+        has_open_questions, has_answered_questions = _section_question_flags(lines, target_id)
 
     return SectionState(
         section_id=target_id,
@@ -194,8 +190,10 @@ def gather_prior_sections(
         # Target not in workflow order, return empty dict
         return prior_sections
 
-    # Parse sections once for efficiency
+    # One pass over the document up front: section spans plus the set of tables
+    # present, so sections without a questions table never trigger a table search
     spans = find_sections(lines)
+    table_ids = {m.group("id") for m in map(TABLE_MARKER_RE.search, lines) if m}
 
     # Iterate through sections before target_id
     for section_id in workflow_order[:target_index]:
@@ -203,6 +201,16 @@ def gather_prior_sections(
         if is_special_workflow_target(section_id):
             continue
 
+        # Section must exist, have no placeholder, a non-empty body and no open
+        # questions; cheapest checks first, reusing the span for each of them
+        span = get_section_span(spans, section_id)
+        if not span or has_placeholder(span, lines):
+            continue
+
+        body = section_body(lines, span)
+        if not body.strip():
+            continue
+
         # Get handler config for this section if available
         handler_config = None
         if handler_registry and doc_type:
@@ -212,22 +220,13 @@ def gather_prior_sections(
                 # If handler config not found, continue without it
                 pass
 
-        # Check if section is complete
-        state = get_section_state(lines, section_id, handler_config)
-
-        # Section must exist, not be blank, have no placeholder, and no open questions
-        if not state.exists:
-            continue
-        if state.has_placeholder or state.has_open_questions:
+        if (
+            _uses_section_questions(handler_config)
+            and get_section_questions_table_name(section_id) in table_ids
+            and _section_question_flags(lines, section_id)[0]
+        ):
             continue
 
-        # Extract section body
-        span = get_section_span(spans, section_id)
-
-        if span:
-            body = section_body(lines, span)
-            # Only include non-empty sections
-            if body.strip():
-                prior_sections[section_id] = body
+        prior_sections[section_id] = body
 
     return prior_sections
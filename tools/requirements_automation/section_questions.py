@@ -7,12 +7,16 @@ replacing the global Open Questions table with per-section Questions & Issues ta
 from __future__ import annotations
 
 import re
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 
 from .config import PLACEHOLDER_TOKEN
 from .models import OpenQuestion
 from .parsing import find_table_block
 
+WHITESPACE_RE = re.compile(r"\s+")
+# Section-scoped question ID, e.g. "problem_statement-Q3" (section is everything before the last -QN)
+SECTION_QUESTION_ID_RE = re.compile(r"^(?P<section>.+)-Q(?P<n>\d+)$")
+
 
 def get_section_questions_table_name(section_id: str) -> str:
     """Return table marker name for section questions.
@@ -105,7 +109,7 @@ def _parse_markdown_table(table_lines: List[str]) -> List[List[str]]:
 
 def _norm(s: str) -> str:
     """Normalize strings for duplicate detection (case/space-insensitive)."""
-    return re.sub(r"\s+", " ", s.strip().lower())
+    return WHITESPACE_RE.sub(" ", s.strip().lower())
 
 
 def _is_placeholder_row(cells: List[str]) -> bool:
@@ -120,27 +124,40 @@ def _build_section_question_row(
     return f"| {qid} | {question} | {date} | {answer} | {status} |"
 
 
-def section_questions_next_id(section_id: str, existing: List[OpenQuestion]) -> str:
-    """Generate the next sequential section-scoped question ID.
+def _scan_section_questions(section_id: str, existing: List[OpenQuestion]) -> Tuple[Set[str], int]:
+    """Collect dedup keys and the highest question number in one pass.
 
     Args:
         section_id: Section identifier
         existing: List of existing questions for this section
 
     Returns:
-        Next question ID (e.g., "problem_statement-Q1")
+        Tuple of (normalized question texts, highest N among section_id-QN IDs)
     """
-    prefix = f"{section_id}-Q"
+    keys: Set[str] = set()
     max_n = 0
 
     for q in existing:
-        # Match section_id-QN pattern
-        pattern = rf"^{re.escape(section_id)}-Q(\d+)$"
-        m = re.match(pattern, q.question_id.strip())
-        if m:
-            max_n = max(max_n, int(m.group(1)))
+        keys.add(_norm(q.question))
+        m = SECTION_QUESTION_ID_RE.match(q.question_id.strip())
+        if m and m.group("section") == section_id:
+            max_n = max(max_n, int(m.group("n")))
 
-    return f"{prefix}{max_n + 1}"
+    return keys, max_n
+
+
+def section_questions_next_id(section_id: str, existing: List[OpenQuestion]) -> str:
+    """Generate the next sequential section-scoped question ID.
+
+    Args:
+        section_id: Section identifier
+        existing: List of existing questions for this section
+
+    Returns:
+        Next question ID (e.g., "problem_statement-Q1")
+    """
+    _, max_n = _scan_section_questions(section_id, existing)
+    return f"{section_id}-Q{max_n + 1}"
 
 
 def insert_section_question(
@@ -163,7 +180,7 @@ def insert_section_question(
     existing, (start, end) = parse_section_questions(lines, section_id)
 
     # Check for duplicates
-    existing_keys = {_norm(q.question) for q in existing}
+    existing_keys, max_n = _scan_section_questions(section_id, existing)
     if _norm(question) in existing_keys:
         # Find existing question ID
         for q in existing:
@@ -171,7 +188,7 @@ def insert_section_question(
                 return lines, q.question_id
 
     # Generate new ID and create row
-    qid = section_questions_next_id(section_id, existing)
+    qid = f"{section_id}-Q{max_n + 1}"
     new_row = _build_section_question_row(qid, question, date, "", "Open")
 
     # Insert after header and separator
@@ -182,7 +199,10 @@ def insert_section_question(
 
 
 def insert_section_questions_batch(
-    lines: List[str], section_id: str, questions: List[Tuple[str, str]]
+    lines: List[str],
+    section_id: str,
+    questions: List[Tuple[str, str]],
+    parsed: Optional[Tuple[List[OpenQuestion], Tuple[int, int]]] = None,
 ) -> Tuple[List[str], int]:
     """Insert multiple questions into section table, skipping duplicates.
 
@@ -190,14 +210,18 @@ def insert_section_questions_batch(
         lines: Document content as list of strings
         section_id: Section identifier
         questions: List of (question_text, date) tuples
+        parsed: Optional result of parse_section_questions(lines, section_id) for
+            these same lines, so callers that already parsed the table avoid a re-parse
 
     Returns:
         Tuple of (updated_lines, insertion_count)
     """
-    existing, (start, end) = parse_section_questions(lines, section_id)
+    if parsed is None:
+        parsed = parse_section_questions(lines, section_id)
+    existing, (start, end) = parsed
 
-    # Track existing questions
-    existing_keys = {_norm(q.question) for q in existing}
+    # One pass over existing questions for both dedup keys and the next ID
+    existing_keys, max_n = _scan_section_questions(section_id, existing)
     to_insert: List[str] = []
     inserted = 0
 
@@ -206,8 +230,8 @@ def insert_section_questions_batch(
         if key in existing_keys:
             continue
 
-        qid = section_questions_next_id(section_id, existing)
-        existing.append(OpenQuestion(qid, q_text, date, "", section_id, "Open"))
+        max_n += 1
+        qid = f"{section_id}-Q{max_n}"
         to_insert.append(_build_section_question_row(qid, q_text, date, "", "Open"))
         existing_keys.add(key)
         inserted += 1
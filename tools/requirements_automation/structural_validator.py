@@ -9,7 +9,10 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import List, Optional, Tuple
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import ClassVar, DefaultDict, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .config import (
     META_MARKER_RE,
@@ -31,43 +34,75 @@ from .validation_errors import (
 )
 
 
+@dataclass
+class ValidationReport:
+    """Structural errors from one validation run, indexed by error type.
+
+    Errors are bucketed as they are recorded, so callers can read e.g.
+    ``report.duplicate_sections`` without filtering ``errors`` by isinstance.
+    """
+
+    errors: List[StructuralError] = field(default_factory=list)
+    duplicate_sections: List[DuplicateSectionError] = field(default_factory=list)
+    orphaned_locks: List[OrphanedLockError] = field(default_factory=list)
+    malformed_markers: List[MalformedMarkerError] = field(default_factory=list)
+    table_errors: List[TableSchemaError] = field(default_factory=list)
+
+    # Error type -> name of its bucket attribute
+    _BUCKETS: ClassVar[Dict[type, str]] = {
+        DuplicateSectionError: "duplicate_sections",
+        OrphanedLockError: "orphaned_locks",
+        MalformedMarkerError: "malformed_markers",
+        TableSchemaError: "table_errors",
+    }
+
+    def add(self, error: StructuralError) -> None:
+        """Record an error in the flat list and in its typed bucket (if any)."""
+        self.errors.append(error)
+        bucket = self._BUCKETS.get(type(error))
+        if bucket is not None:
+            getattr(self, bucket).append(error)
+
+
 class StructuralValidator:
     """Validates document structural integrity."""
 
-    def __init__(self, lines: List[str], template_lines: Optional[List[str]] = None):
+    def __init__(self, lines: List[str], template_lines: Optional[Sequence[str]] = None):
         """
         Initialize validator with document lines.
 
         Args:
-            lines: Document content as list of strings
+            lines: Document content as list of strings (repaired in place when
+                template-based repair inserts missing markers)
             template_lines: Optional template content for cross-reference validation
+                (any sequence such as a tuple is accepted; it is copied to a list
+                because the repair helpers splice template slices into lists)
         """
         self.lines = lines
-        self.template_lines = template_lines
+        self.template_lines: Optional[List[str]] = (
+            list(template_lines) if template_lines is not None else None
+        )
         self.errors: List[StructuralError] = []
+        self.report = ValidationReport(errors=self.errors)
         self.repairs_made: List[str] = []
+        # {section_id: [line_numbers]} from the most recent section-marker scan
+        self._section_lines: DefaultDict[str, List[int]] = defaultdict(list)
 
     def validate_all(self) -> List[StructuralError]:
         """
         Run all structural validations and return errors.
 
+        The same errors are also available bucketed by type on ``self.report``.
+
         Returns:
             List of StructuralError instances found during validation
         """
         self.errors = []
+        self.report = ValidationReport(errors=self.errors)
         self.repairs_made = []
 
-        self._validate_section_markers()
-        self._validate_lock_markers()
-        self._validate_table_markers()
-        self._validate_subsection_markers()
-        self._validate_open_questions_table()
-        self._validate_metadata_markers()
-        self._validate_workflow_order_marker()
-
-        # Template-based validation (only if template is provided)
-        if self.template_lines:
-            self._validate_against_template()
+        for error in self._iter_errors():
+            self.report.add(error)
 
         return self.errors
 
@@ -75,71 +110,80 @@ class StructuralValidator:
         """
         Run validations and raise first error encountered.
 
+        Checks run lazily, so validation stops at the first error instead of
+        running the remaining checks.
+
         Raises:
             StructuralError: First validation error found
         """
-        errors = self.validate_all()
-        if errors:
-            raise errors[0]
+        self.repairs_made = []
+        for error in self._iter_errors():
+            raise error
+
+    def _iter_errors(self) -> Iterator[StructuralError]:
+        """Run each structural check in order, yielding errors as they are found."""
+        yield from self._validate_section_markers()
+        yield from self._validate_lock_markers()
+        yield from self._validate_table_markers()
+        yield from self._validate_subsection_markers()
+        self._validate_open_questions_table()
+        self._validate_metadata_markers()
+        self._validate_workflow_order_marker()
+
+        # Template-based validation (only if template is provided)
+        if self.template_lines:
+            yield from self._validate_against_template()
 
-    def _validate_section_markers(self) -> None:
+    def _validate_section_markers(self) -> Iterator[StructuralError]:
         """Check: no duplicates, all well-formed, no orphaned spans."""
-        section_ids: dict[str, list[int]] = {}  # {section_id: [line_numbers]}
+        # Single pass: collect every marker's line numbers; lock validation reuses this map
+        # (it always runs after this check has been fully consumed).
+        section_lines: DefaultDict[str, List[int]] = defaultdict(list)
 
-        for i, line in enumerate(self.lines):
+        for i, line in enumerate(self.lines, 1):
             match = SECTION_MARKER_RE.search(line)
             if match:
-                section_id = match.group("id")
+                # Interned so repeated IDs share one object and dict/set lookups compare by identity
+                section_id = sys.intern(match.group("id"))
 
                 # Check well-formed (section IDs should be lowercase alphanumeric with underscores)
                 # Note: SECTION_MARKER_RE already enforces [a-z0-9_]+, but we validate here
                 # for defense in depth in case the regex is changed to be more permissive.
                 if not re.fullmatch(r"[a-z0-9_]+", section_id):
-                    self.errors.append(
-                        MalformedMarkerError(
-                            i + 1, line, f"Invalid section ID format: {section_id}"
-                        )
-                    )
+                    yield MalformedMarkerError(i, line, f"Invalid section ID format: {section_id}")
 
-                # Track for duplicate detection
-                if section_id not in section_ids:
-                    section_ids[section_id] = []
-                section_ids[section_id].append(i + 1)
+                section_lines[section_id].append(i)
+
+        self._section_lines = section_lines
 
         # Check for duplicates
-        for section_id, line_nums in section_ids.items():
+        for section_id, line_nums in section_lines.items():
             if len(line_nums) > 1:
-                self.errors.append(DuplicateSectionError(section_id, line_nums))
+                yield DuplicateSectionError(section_id, line_nums)
 
-    def _validate_lock_markers(self) -> None:
+    def _validate_lock_markers(self) -> Iterator[StructuralError]:
         """Check: every lock has corresponding section, lock value is boolean."""
-        # Collect all section IDs
-        section_ids = set()
-        for line in self.lines:
-            match = SECTION_MARKER_RE.search(line)
-            if match:
-                section_ids.add(match.group("id"))
+        # Section IDs were collected by _validate_section_markers
+        section_ids = self._section_lines.keys()
 
         # Check lock markers
         for i, line in enumerate(self.lines):
             match = SECTION_LOCK_RE.search(line)
             if match:
-                lock_id = match.group("id")
+                lock_id = sys.intern(match.group("id"))
                 lock_value = match.group("lock")
 
                 # Check section exists
                 if lock_id not in section_ids:
-                    self.errors.append(OrphanedLockError(lock_id, i + 1))
+                    yield OrphanedLockError(lock_id, i + 1)
 
                 # Check lock value (should always be true or false per regex, but validate anyway)
                 if lock_value not in ("true", "false"):
-                    self.errors.append(
-                        MalformedMarkerError(
-                            i + 1, line, f"Lock value must be 'true' or 'false', got: {lock_value}"
-                        )
+                    yield MalformedMarkerError(
+                        i + 1, line, f"Lock value must be 'true' or 'false', got: {lock_value}"
                     )
 
-    def _validate_table_markers(self) -> None:
+    def _validate_table_markers(self) -> Iterator[StructuralError]:
         """Check: table markers are well-formed."""
         for i, line in enumerate(self.lines):
             match = TABLE_MARKER_RE.search(line)
@@ -150,11 +194,9 @@ class StructuralValidator:
                 # Note: TABLE_MARKER_RE already enforces [a-z0-9_]+, but we validate here
                 # for defense in depth in case the regex is changed to be more permissive.
                 if not re.fullmatch(r"[a-z0-9_]+", table_id):
-                    self.errors.append(
-                        MalformedMarkerError(i + 1, line, f"Invalid table ID format: {table_id}")
-                    )
+                    yield MalformedMarkerError(i + 1, line, f"Invalid table ID format: {table_id}")
 
-    def _validate_subsection_markers(self) -> None:
+    def _validate_subsection_markers(self) -> Iterator[StructuralError]:
         """Check: subsection markers are well-formed."""
         for i, line in enumerate(self.lines):
             match = SUBSECTION_MARKER_RE.search(line)
@@ -165,10 +207,8 @@ class StructuralValidator:
                 # Note: SUBSECTION_MARKER_RE already enforces [a-z0-9_]+, but we validate here
                 # for defense in depth in case the regex is changed to be more permissive.
                 if not re.fullmatch(r"[a-z0-9_]+", subsection_id):
-                    self.errors.append(
-                        MalformedMarkerError(
-                            i + 1, line, f"Invalid subsection ID format: {subsection_id}"
-                        )
+                    yield MalformedMarkerError(
+                        i + 1, line, f"Invalid subsection ID format: {subsection_id}"
                     )
 
     def _validate_open_questions_table(self) -> None:
@@ -184,7 +224,7 @@ class StructuralValidator:
         # Each section now has its own questions table (e.g., problem_statement_questions)
         pass
 
-    def _validate_against_template(self) -> None:
+    def _validate_against_template(self) -> Iterator[StructuralError]:
         """Validate document against template to ensure all structural markers are present."""
         if not self.template_lines:
             return
@@ -236,13 +276,11 @@ class StructuralValidator:
             if self._try_repair_missing_section(section_id, template_sections[section_id]):
                 self.repairs_made.append(f"section:{section_id}")
             else:
-                self.errors.append(
-                    MalformedMarkerError(
-                        0,
-                        "",
-                        f"Missing section from template: <!-- section:{section_id} -->. "
-                        f"Add this section marker and its content to match the template structure.",
-                    )
+                yield MalformedMarkerError(
+                    0,
+                    "",
+                    f"Missing section from template: <!-- section:{section_id} -->. "
+                    f"Add this section marker and its content to match the template structure.",
                 )
 
         # Repair missing subsections
@@ -252,13 +290,11 @@ class StructuralValidator:
             ):
                 self.repairs_made.append(f"subsection:{subsection_id}")
             else:
-                self.errors.append(
-                    MalformedMarkerError(
-                        0,
-                        "",
-                        f"Missing subsection from template: <!-- subsection:{subsection_id} -->. "
-                        f"Add this subsection marker within its parent section to match the template structure.",
-                    )
+                yield MalformedMarkerError(
+                    0,
+                    "",
+                    f"Missing subsection from template: <!-- subsection:{subsection_id} -->. "
+                    f"Add this subsection marker within its parent section to match the template structure.",
                 )
 
         # Repair missing tables
@@ -266,13 +302,11 @@ class StructuralValidator:
             if self._try_repair_missing_table(table_id, template_tables[table_id]):
                 self.repairs_made.append(f"table:{table_id}")
             else:
-                self.errors.append(
-                    MalformedMarkerError(
-                        0,
-                        "",
-                        f"Missing table from template: <!-- table:{table_id} -->. "
-                        f"Add this table marker and its header within the appropriate section to match the template structure.",
-                    )
+                yield MalformedMarkerError(
+                    0,
+                    "",
+                    f"Missing table from template: <!-- table:{table_id} -->. "
+                    f"Add this table marker and its header within the appropriate section to match the template structure.",
                 )
 
     def _try_repair_missing_section(self, section_id: str, template_line_num: int) -> bool:
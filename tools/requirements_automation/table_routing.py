@@ -17,6 +17,15 @@ from .config import SUBSECTION_MARKER_RE, TABLE_MARKER_RE, PLACEHOLDER_TOKEN
 # Constants for markdown parsing
 SUBSECTION_HEADER_PREFIX = "###"  # Markdown subsection header marker
 TABLE_SEPARATOR_PATTERN = r'^\s*\|[\s\-:|]+\|\s*$'  # Regex for table separator rows like |---|---|
+TABLE_SEPARATOR_RE = re.compile(TABLE_SEPARATOR_PATTERN)
+
+
+def _is_table_row(stripped: str) -> bool:
+    """Return True if a stripped line is a pipe-delimited table row (| ... |).
+
+    Uses plain string checks rather than a regex, so there is no backtracking.
+    """
+    return len(stripped) >= 2 and stripped.startswith('|') and stripped.endswith('|')
 
 
 def _extract_markdown_table_rows(text: str) -> List[str]:
@@ -46,7 +55,7 @@ def _extract_markdown_table_rows(text: str) -> List[str]:
             found_separator = False  # Reset when we leave a table
             continue
         # Check for separator rows (e.g., |---|---|)
-        if re.match(TABLE_SEPARATOR_PATTERN, stripped):
+        if TABLE_SEPARATOR_RE.match(stripped):
             found_separator = True
             continue
         
@@ -113,7 +122,7 @@ def _identify_table_content_by_subsection(
         # If we're in a table subsection, collect table rows
         if current_subsection and '|' in stripped:
             # Skip separator and header rows
-            if re.match(TABLE_SEPARATOR_PATTERN, stripped):
+            if TABLE_SEPARATOR_RE.match(stripped):
                 continue
             result[current_subsection].append(stripped)
     
@@ -151,7 +160,7 @@ def _extract_non_table_content(llm_output: str) -> str:
         # Skip table rows
         if '|' in stripped:
             # Check if it's a table row
-            if re.match(r'^\s*\|.*\|\s*$', stripped):
+            if _is_table_row(stripped):
                 continue
         
         filtered.append(line)
@@ -197,10 +206,10 @@ def _insert_table_rows_into_subsection(
             if table_start is None:
                 table_start = i
                 # First row is likely the header
-                if not re.match(TABLE_SEPARATOR_PATTERN, stripped):
+                if not TABLE_SEPARATOR_RE.match(stripped):
                     header_row_idx = i
             # Check for separator row
-            elif re.match(TABLE_SEPARATOR_PATTERN, stripped):
+            elif TABLE_SEPARATOR_RE.match(stripped):
                 separator_row_idx = i
                 # Stop after separator - data rows should follow
                 break
@@ -28,6 +28,17 @@ VERSION_MILESTONES = {
     "approval_record": "1.0",
 }
 
+# Version-metadata patterns, compiled once rather than on every update pass
+VERSION_FORMAT_RE = re.compile(r"^(\d+)\.(\d+)$")
+META_VERSION_RE = re.compile(r"<!--\s*meta:version\s*-->")
+VERSION_VALUE_RE = re.compile(r"(-\s*\*\*Version:\*\*\s*)(\d+\.\d+)")
+DOCUMENT_CONTROL_TABLE_RE = re.compile(r"<!--\s*table:document_control\s*-->")
+CURRENT_VERSION_ROW_RE = re.compile(r"(\|\s*Current Version\s*\|\s*)(\d+\.\d+)(\s*\|)")
+VERSION_HISTORY_MARKER_RE = re.compile(r"<!--\s*subsection:version_history\s*-->")
+PLACEHOLDER_RE = re.compile(r"<!--\s*PLACEHOLDER\s*-->")
+# Patterns that mark the end of a subsection
+SECTION_END_RE = re.compile(r"<!--\s*(section|subsection|section_lock):")
+
 
 def get_version_for_section(section_id: str) -> str:
     """Return target version milestone associated with a section.
@@ -54,7 +65,7 @@ def _parse_version(version: str) -> Tuple[int, int]:
     Raises:
         ValueError: If version format is invalid
     """
-    match = re.match(r"^(\d+)\.(\d+)$", version.strip())
+    match = VERSION_FORMAT_RE.match(version.strip())
     if not match:
         raise ValueError(f"Invalid version format: {version}. Expected X.Y where X, Y are integers")
     return int(match.group(1)), int(match.group(2))
@@ -111,61 +122,48 @@ def _extract_current_version(lines: List[str]) -> str:
         Current version string or "0.0" if not found
     """
     # Look for <!-- meta:version --> marker
-    meta_version_re = re.compile(r"<!--\s*meta:version\s*-->")
-    version_value_re = re.compile(r"-\s*\*\*Version:\*\*\s*(\d+\.\d+)")
-
     for i, line in enumerate(lines):
-        if meta_version_re.search(line):
+        if META_VERSION_RE.search(line):
             # Check next line for version value
             if i + 1 < len(lines):
-                match = version_value_re.search(lines[i + 1])
+                match = VERSION_VALUE_RE.search(lines[i + 1])
                 if match:
-                    return match.group(1)
+                    return match.group(2)
 
     return "0.0"
 
 
-def _update_version_history_table(lines: List[str], new_version: str, changes: str) -> List[str]:
-    """Add entry to Version History table.
+def _update_version_history_table(lines: List[str], new_version: str, changes: str) -> None:
+    """Add entry to Version History table, editing lines in place.
 
     Args:
-        lines: Document content as list of strings
+        lines: Document content as list of strings (modified in place)
         new_version: New version to add to history
         changes: Description of changes for this version
-
-    Returns:
-        Updated lines with new version history entry
     """
     from .config import AUTOMATION_ACTOR
 
-    # Find the Version History subsection
-    subsection_marker_re = re.compile(r"<!--\s*subsection:version_history\s*-->")
-    placeholder_re = re.compile(r"<!--\s*PLACEHOLDER\s*-->")
-    # Patterns that mark the end of a subsection
-    section_end_re = re.compile(r"<!--\s*(section|subsection|section_lock):")
-
-    result_lines = lines[:]
     marker_idx = None
     subsection_end_idx = None
 
     # Find the version history subsection marker
-    for i, line in enumerate(result_lines):
-        if subsection_marker_re.search(line):
+    for i, line in enumerate(lines):
+        if VERSION_HISTORY_MARKER_RE.search(line):
             marker_idx = i
             break
 
     if marker_idx is None:
         # Can't find version history subsection, return unchanged
-        return result_lines
+        return
 
     # Find the end of the version history subsection
-    for i in range(marker_idx + 1, len(result_lines)):
-        if section_end_re.search(result_lines[i]) or result_lines[i].strip() == "---":
+    for i in range(marker_idx + 1, len(lines)):
+        if SECTION_END_RE.search(lines[i]) or lines[i].strip() == "---":
             subsection_end_idx = i
             break
 
     if subsection_end_idx is None:
-        subsection_end_idx = len(result_lines)
+        subsection_end_idx = len(lines)
 
     # Create new version entry
     today = iso_today()
@@ -174,100 +172,77 @@ def _update_version_history_table(lines: List[str], new_version: str, changes: s
     # Check if this version already exists in the version history table
     # Split by | and normalize whitespace to handle variations in spacing
     for i in range(marker_idx, subsection_end_idx):
-        line = result_lines[i].strip()
+        line = lines[i].strip()
         if line.startswith("|"):
             cells = [cell.strip() for cell in line.split("|")]
             # Version is typically in the first cell after the leading |
             if len(cells) > 1 and cells[1] == new_version:
                 # Version already exists, skip insertion
-                return result_lines
+                return
 
     # Look for placeholder within the version history subsection
     placeholder_idx = None
     for i in range(marker_idx, subsection_end_idx):
-        if placeholder_re.search(result_lines[i]):
+        if PLACEHOLDER_RE.search(lines[i]):
             placeholder_idx = i
             break
 
     if placeholder_idx is not None:
         # Replace placeholder with new entry
-        result_lines[placeholder_idx] = new_entry
+        lines[placeholder_idx] = new_entry
     else:
         # No placeholder found, append after last table row
         last_table_row_idx = None
         for i in range(marker_idx, subsection_end_idx):
-            if result_lines[i].strip().startswith("|"):
+            if lines[i].strip().startswith("|"):
                 last_table_row_idx = i
 
         if last_table_row_idx is not None:
             # Insert new entry after the last table row
-            result_lines.insert(last_table_row_idx + 1, new_entry)
-
-    return result_lines
+            lines.insert(last_table_row_idx + 1, new_entry)
 
 
-def _update_meta_version(lines: List[str], new_version: str) -> List[str]:
-    """Update <!-- meta:version --> marker and associated value.
+def _update_meta_version(lines: List[str], new_version: str) -> None:
+    """Update <!-- meta:version --> marker and associated value, editing lines in place.
 
     Args:
-        lines: Document content as list of strings
+        lines: Document content as list of strings (modified in place)
         new_version: New version to set
-
-    Returns:
-        Updated lines with new version
     """
-    meta_version_re = re.compile(r"<!--\s*meta:version\s*-->")
-    version_value_re = re.compile(r"(-\s*\*\*Version:\*\*\s*)(\d+\.\d+)")
-
-    result_lines = lines[:]
-
-    for i, line in enumerate(result_lines):
-        if meta_version_re.search(line):
+    for i, line in enumerate(lines):
+        if META_VERSION_RE.search(line):
             # Update next line if it contains version value
-            if i + 1 < len(result_lines):
-                match = version_value_re.search(result_lines[i + 1])
+            if i + 1 < len(lines):
+                match = VERSION_VALUE_RE.search(lines[i + 1])
                 if match:
-                    result_lines[i + 1] = version_value_re.sub(
-                        rf"\g<1>{new_version}", result_lines[i + 1]
-                    )
+                    lines[i + 1] = VERSION_VALUE_RE.sub(rf"\g<1>{new_version}", lines[i + 1])
                     break
 
-    return result_lines
-
 
-def _update_document_control_table(lines: List[str], new_version: str) -> List[str]:
-    """Update Current Version in Document Control table.
+def _update_document_control_table(lines: List[str], new_version: str) -> None:
+    """Update Current Version in Document Control table, editing lines in place.
 
     Args:
-        lines: Document content as list of strings
+        lines: Document content as list of strings (modified in place)
         new_version: New version to set
-
-    Returns:
-        Updated lines with new version in Document Control table
     """
     # Find Document Control table and update Current Version row
-    table_re = re.compile(r"<!--\s*table:document_control\s*-->")
-    version_row_re = re.compile(r"(\|\s*Current Version\s*\|\s*)(\d+\.\d+)(\s*\|)")
-
-    result_lines = lines[:]
     in_table = False
 
-    for i, line in enumerate(result_lines):
-        if table_re.search(line):
+    for i, line in enumerate(lines):
+        if DOCUMENT_CONTROL_TABLE_RE.search(line):
             in_table = True
             continue
 
         if in_table:
-            match = version_row_re.search(line)
+            match = CURRENT_VERSION_ROW_RE.search(line)
             if match:
-                result_lines[i] = version_row_re.sub(rf"\g<1>{new_version}\g<3>", line)
+                lines[i] = CURRENT_VERSION_ROW_RE.sub(rf"\g<1>{new_version}\g<3>", line)
                 break
             # Stop if we hit another section marker or empty section
             if line.strip().startswith("<!--") and "section:" in line:
                 break
 
-    return result_lines
-
 
 def update_document_version(lines: List[str], new_version: str, changes: str) -> List[str]:
     """Update version metadata throughout the document.
@@ -285,16 +260,17 @@ def update_document_version(lines: List[str], new_version: str, changes: str) ->
     Returns:
         Updated lines with new version information
     """
+    # Copy once; the helpers below edit this copy in place
     result = lines[:]
 
     # Update meta version marker
-    result = _update_meta_version(result, new_version)
+    _update_meta_version(result, new_version)
 
     # Update Document Control table
-    result = _update_document_control_table(result, new_version)
+    _update_document_control_table(result, new_version)
 
     # Add entry to Version History
-    result = _update_version_history_table(result, new_version, changes)
+    _update_version_history_table(result, new_version, changes)
 
     return result
 